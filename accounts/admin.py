@@ -8,6 +8,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group
 from django.contrib.admin.models import LogEntry
+from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 from simple_history.admin import SimpleHistoryAdmin
 
@@ -106,7 +107,7 @@ class UserAdmin(SimpleHistoryAdmin, BaseUserAdmin):
 
     def get_groups(self, obj):
         """Display user groups."""
-        return ", ".join([g.name for g in obj.groups.all()]) or "-"
+        return ", ".join(g.name for g in obj.groups.all()) or "-"
     
     get_groups.short_description = _("Groups")
 
@@ -119,7 +120,9 @@ class UserAdmin(SimpleHistoryAdmin, BaseUserAdmin):
 
     def get_queryset(self, request):
         """Limit queryset based on user type."""
-        qs = super().get_queryset(request)
+        qs = super().get_queryset(request).prefetch_related(
+            Prefetch("groups", queryset=Group.objects.only("id", "name"))
+        )
         # Non-superusers can only see non-superusers
         if not request.user.is_superuser:
             return qs.filter(is_superuser=False)
@@ -2,6 +2,7 @@
 Seed users: 1 admin, 5 customers.
 """
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
 
 from accounts.models import User, UserType
@@ -32,7 +33,8 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         if options["clear"]:
             self.stdout.write("Clearing non-superuser accounts...")
-            User.objects.filter(is_superuser=False).delete()
+            _, deleted = User.objects.filter(is_superuser=False).delete()
+            self.stdout.write(f"  Deleted {deleted.get(User._meta.label, 0)} user(s)")
 
         self._create_users(ADMIN_USERS, UserType.ADMIN, "Admin")
         self._create_users(CUSTOMERS, UserType.CUSTOMER, "Customer")
@@ -41,30 +43,25 @@ class Command(BaseCommand):
 
     def _create_users(self, users_data, user_type, label):
         self.stdout.write(f"\nSeeding {label}s...")
+        # One lookup for the whole list instead of a get_or_create per user.
+        # New users still go through create() so the post_save profile
+        # signals run.
+        existing = User.objects.in_bulk([data["email"] for data in users_data], field_name="email")
         for data in users_data:
             email = data["email"]
-            password = data.pop("password")
-            is_staff = data.pop("is_staff", user_type != UserType.CUSTOMER)
-            is_superuser = data.pop("is_superuser", False)
-
-            user, created = User.objects.get_or_create(
-                email=email,
-                defaults={
-                    **data,
-                    "user_type": user_type,
-                    "is_staff": is_staff,
-                    "is_superuser": is_superuser,
-                    "is_email_verified": True,
-                    "is_active": True,
-                },
-            )
-            if created:
-                user.set_password(password)
-                user.save(update_fields=["password"])
-                self.stdout.write(self.style.SUCCESS(f"  Created: {user.get_full_name()} ({email})"))
-            else:
+            user = existing.get(email)
+            if user is not None:
                 self.stdout.write(f"  Exists: {user.get_full_name()} ({email})")
+                continue
 
-            data["password"] = password  # restore
-            if "is_staff" not in data and user_type != UserType.CUSTOMER:
-                pass  # already handled
+            fields = {k: v for k, v in data.items() if k != "password"}
+            fields.setdefault("is_staff", user_type != UserType.CUSTOMER)
+            fields.setdefault("is_superuser", False)
+            user = User.objects.create(
+                **fields,
+                user_type=user_type,
+                is_email_verified=True,
+                is_active=True,
+                password=make_password(data["password"]),
+            )
+            self.stdout.write(self.style.SUCCESS(f"  Created: {user.get_full_name()} ({email})"))
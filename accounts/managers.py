@@ -6,16 +6,21 @@ Handles user creation with email/phone authentication.
 
 from django.contrib.auth.models import BaseUserManager
 from django.utils.translation import gettext_lazy as _
+from phonenumber_field.phonenumber import PhoneNumber
 
 
 def normalize_phone_number(phone_number):
     """
     Normalize phone number by ensuring it starts with '+'.
 
-    Allows phone numbers with or without the '+' prefix.
+    Allows phone numbers with or without the '+' prefix. ``PhoneNumber``
+    instances are rendered directly as E.164.
     """
     if phone_number:
-        phone_str = str(phone_number)
+        if isinstance(phone_number, PhoneNumber):
+            phone_str = phone_number.as_e164
+        else:
+            phone_str = str(phone_number)
         if not phone_str.startswith("+"):
             phone_str = f"+{phone_str}"
         return phone_str
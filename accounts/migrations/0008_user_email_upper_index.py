@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:47
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_datadeletionrequest"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.db.models.functions.text.Upper("email"),
+                name="accounts_user_email_upper_idx",
+            ),
+        ),
+    ]
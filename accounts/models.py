@@ -10,6 +10,7 @@ from datetime import timedelta
 
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
@@ -110,6 +111,11 @@ class User(AbstractBaseUser, PermissionsMixin):
                 name="phone_required",
             )
         ]
+        indexes = [
+            # Serves the case-insensitive email__iexact lookups on login,
+            # password reset and registration checks.
+            models.Index(Upper("email"), name="accounts_user_email_upper_idx"),
+        ]
 
     def __str__(self):
         return self.email or str(self.phone_number) or str(self.id)
@@ -17,32 +17,12 @@ from django.utils.translation import gettext_lazy as _
 from phonenumber_field.serializerfields import PhoneNumberField
 from rest_framework import serializers
 
+from .managers import normalize_phone_number
 from .models import DataDeletionRequest, SocialAuthProvider, UserType, VerificationCode
 
 User = get_user_model()
 
 
-def normalize_phone_number(phone_number):
-    """
-    Normalize phone number by ensuring it starts with '+'.
-
-    Allows users to provide phone numbers with or without the '+' prefix.
-    For example, both '+97451235119' and '97451235119' will be accepted.
-
-    Args:
-        phone_number: Phone number string or PhoneNumber object.
-
-    Returns:
-        The phone number with '+' prefix ensured.
-    """
-    if phone_number:
-        phone_str = str(phone_number)
-        if not phone_str.startswith("+"):
-            phone_str = f"+{phone_str}"
-        return phone_str
-    return phone_number
-
-
 class FlexiblePhoneNumberField(PhoneNumberField):
     """
     PhoneNumberField that auto-prepends '+' if missing.
@@ -18,6 +18,10 @@ from config.utils.sms_service import send_sms, send_sms_async
 
 logger = logging.getLogger(__name__)
 
+# Resolved once per process instead of going through LazySettings on every send.
+DEFAULT_FROM_EMAIL = settings.DEFAULT_FROM_EMAIL
+VERIFICATION_CODE_EXPIRY_MINUTES = getattr(settings, "VERIFICATION_CODE_EXPIRY_MINUTES", 10)
+
 
 # ============================================================================
 # Email Tasks (sent directly – SES handles delivery async)
@@ -45,7 +49,7 @@ def send_email_verification(email, code, is_password_reset=False):
 
         context = {
             "code": code,
-            "expiry_minutes": getattr(settings, "VERIFICATION_CODE_EXPIRY_MINUTES", 10),
+            "expiry_minutes": VERIFICATION_CODE_EXPIRY_MINUTES,
         }
 
         try:
@@ -65,7 +69,7 @@ def send_email_verification(email, code, is_password_reset=False):
 
         ses_mailer.send(
             subject=subject,
-            sender=settings.DEFAULT_FROM_EMAIL,
+            sender=DEFAULT_FROM_EMAIL,
             to=[email],
             html_body=html_message,
             text_body=plain_message,
@@ -106,7 +110,7 @@ def send_welcome_email(email, first_name):
 
         ses_mailer.send(
             subject=subject,
-            sender=settings.DEFAULT_FROM_EMAIL,
+            sender=DEFAULT_FROM_EMAIL,
             to=[email],
             html_body=html_message,
             text_body=plain_message,
@@ -158,7 +162,7 @@ def send_employee_created_email(email, first_name, temporary_password):
 
         ses_mailer.send(
             subject=subject,
-            sender=settings.DEFAULT_FROM_EMAIL,
+            sender=DEFAULT_FROM_EMAIL,
             to=[email],
             html_body=html_message,
             text_body=plain_message,
@@ -187,7 +191,7 @@ def send_sms_verification(phone_number, code):
     Returns:
         dict: SQS dispatch result with 'success' and 'message_id' or 'error'.
     """
-    expiry_minutes = getattr(settings, "VERIFICATION_CODE_EXPIRY_MINUTES", 10)
+    expiry_minutes = VERIFICATION_CODE_EXPIRY_MINUTES
     message = f"Your verification code is: {code}. It expires in {expiry_minutes} minutes."
 
     logger.info("Sending OTP SMS for %s using send_sms_async", phone_number)
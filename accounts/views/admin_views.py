@@ -129,18 +129,17 @@ class UserStatisticsView(generics.GenericAPIView):
         # Total counts by type
         type_counts = User.objects.values("user_type").annotate(count=Count("id"))
 
-        # Active vs inactive
-        active_count = User.objects.filter(is_active=True).count()
-        inactive_count = User.objects.filter(is_active=False).count()
-
-        # Verified counts
-        verified_count = User.objects.filter(
-            Q(is_email_verified=True) | Q(is_phone_verified=True)
-        ).count()
-
-        # New users (last 30 days)
+        # Total, active/inactive, verified and new (last 30 days) in one query
         thirty_days_ago = timezone.now() - timedelta(days=30)
-        new_users = User.objects.filter(date_joined__gte=thirty_days_ago).count()
+        totals = User.objects.aggregate(
+            total=Count("id"),
+            active=Count("id", filter=Q(is_active=True)),
+            inactive=Count("id", filter=Q(is_active=False)),
+            verified=Count(
+                "id", filter=Q(is_email_verified=True) | Q(is_phone_verified=True)
+            ),
+            new=Count("id", filter=Q(date_joined__gte=thirty_days_ago)),
+        )
 
         # Social auth users
         from accounts.models import SocialAuthProvider
@@ -149,12 +148,12 @@ class UserStatisticsView(generics.GenericAPIView):
         )
 
         return Response({
-            "total_users": User.objects.count(),
+            "total_users": totals["total"],
             "by_type": {item["user_type"]: item["count"] for item in type_counts},
-            "active_users": active_count,
-            "inactive_users": inactive_count,
-            "verified_users": verified_count,
-            "new_users_30_days": new_users,
+            "active_users": totals["active"],
+            "inactive_users": totals["inactive"],
+            "verified_users": totals["verified"],
+            "new_users_30_days": totals["new"],
             "social_auth_users": {
                 item["provider"]: item["count"] for item in social_users
             },
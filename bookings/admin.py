@@ -264,7 +264,8 @@ class BookingAdmin(SpaCenterRestrictedAdminMixin, SimpleHistoryAdmin):
             .get_queryset(request)
             .select_related(
                 "customer",
-                "spa_center",
+                "spa_center__city",
+                "spa_center__country",
                 "service",
                 "service_arrangement",
                 "time_slot",
@@ -545,5 +546,9 @@ class HomeServiceBookingAdmin(admin.ModelAdmin):
         return (
             super()
             .get_queryset(request)
-            .select_related("customer", "home_service")
+            .select_related(
+                "customer",
+                "home_service__city",
+                "home_service__country",
+            )
         )
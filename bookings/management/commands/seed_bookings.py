@@ -34,10 +34,12 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         if options["clear"]:
             self.stdout.write("Clearing existing bookings...")
-            OrderItem.objects.all().delete()
-            ProductOrder.objects.all().delete()
+            # Order and slot rows have no dependants left at their turn, so
+            # they skip Django's cascade collector.
+            OrderItem.objects.all()._raw_delete(OrderItem.objects.db)
+            ProductOrder.objects.all()._raw_delete(ProductOrder.objects.db)
             Booking.objects.all().delete()
-            TimeSlot.objects.all().delete()
+            TimeSlot.objects.all()._raw_delete(TimeSlot.objects.db)
 
         self._seed_bookings()
         self._seed_product_orders()
@@ -68,6 +70,14 @@ class Command(BaseCommand):
             Booking.BookingStatus.REQUESTED,
         ]
 
+        # First price record (by pk) per arrangement, with its service
+        from spacenter.models import ServiceArrangementPrice
+        price_records = {}
+        for record in ServiceArrangementPrice.objects.filter(
+            service_arrangement__in=arrangements
+        ).select_related("service").order_by("pk"):
+            price_records.setdefault(record.service_arrangement_id, record)
+
         created_count = 0
         for day_offset in range(14):
             booking_date = today + timedelta(days=day_offset)
@@ -84,10 +94,7 @@ class Command(BaseCommand):
                 start_t = time(start_hour, 0)
 
                 # Pick a service allowed by the arrangement
-                from spacenter.models import ServiceArrangementPrice
-                price_record = ServiceArrangementPrice.objects.filter(
-                    service_arrangement=arrangement
-                ).first()
+                price_record = price_records.get(arrangement.id)
                 service = price_record.service if price_record else None
 
                 if not service:
@@ -5,6 +5,7 @@ Serializers for service arrangements, time slots, availability, and booking mana
 """
 
 from datetime import datetime, timedelta
+from decimal import Decimal
 
 from django.db import transaction
 from django.utils import timezone
@@ -18,6 +19,7 @@ from spacenter.serializers import (
 from spacenter.models import ServiceArrangement
 
 from .models import Booking, TimeSlot, ProductOrder, OrderItem, HomeServiceBooking
+from .utils import ZERO_AMOUNT, to_decimal
 
 
 # =============================================================================
@@ -545,16 +547,18 @@ class BookingCreateSerializer(serializers.Serializer):
             })
 
         # ------------------------------------------------------------------
-        # 5. Availability check — use arr.capacity (supports both Room & legacy)
+        # 5. Availability check — the arrangement's room must be free
         # ------------------------------------------------------------------
-        overlapping_count = TimeSlot.objects.filter(
+        # Each arrangement is a single room (capacity is always 1), so any
+        # overlapping slot makes it unavailable.
+        is_booked = TimeSlot.objects.filter(
             arrangement=selected_arrangement,
             date=date,
             start_time__lt=end_time,
             end_time__gt=start_time,
-        ).count()
+        ).exists()
 
-        if overlapping_count >= selected_arrangement.capacity:
+        if is_booked:
             raise serializers.ValidationError({
                 "start_time": "Selected arrangement has no available space for this time."
             })
@@ -566,7 +570,6 @@ class BookingCreateSerializer(serializers.Serializer):
         # ------------------------------------------------------------------
         # 6. Calculate Financials
         # ------------------------------------------------------------------
-        from decimal import Decimal
         from spacenter.models import ServiceArrangementPrice
         arr_price_obj = ServiceArrangementPrice.objects.filter(
             service=service,
@@ -576,12 +579,12 @@ class BookingCreateSerializer(serializers.Serializer):
         
         # Populate price_for_extra_minutes
         extra_minutes = int(attrs.get("extra_minutes", 0))
-        price_for_extra = Decimal("0.00")
+        price_for_extra = ZERO_AMOUNT
         if extra_minutes > 0 and arr_price_obj:
             if arr_price_obj.price_for_extra_minutes is not None:
                 price_for_extra = arr_price_obj.price_for_extra_minutes
             else:
-                price_for_extra = (base_price / Decimal(str(service.duration_minutes))) * Decimal(str(extra_minutes))
+                price_for_extra = (base_price / Decimal(service.duration_minutes)) * Decimal(extra_minutes)
                 price_for_extra = price_for_extra.quantize(Decimal("0.01"))
         
         attrs["price_for_extra_minutes"] = price_for_extra
@@ -606,10 +609,9 @@ class BookingCreateSerializer(serializers.Serializer):
         )
         
         # Financials
-        from decimal import Decimal
         extra_minutes = int(validated_data.get("extra_minutes", 0))
-        price_for_extra = Decimal(str(validated_data.get("price_for_extra_minutes", 0)))
-        discount_amount = Decimal(str(validated_data.get("discount_amount", 0)))
+        price_for_extra = to_decimal(validated_data.get("price_for_extra_minutes"))
+        discount_amount = to_decimal(validated_data.get("discount_amount"))
         
         # Total duration = service duration + extra minutes
         service = validated_data["service"]
@@ -631,7 +633,7 @@ class BookingCreateSerializer(serializers.Serializer):
             else:
                 final_payable = subtotal - discount_amount
             if final_payable < 0:
-                final_payable = Decimal("0.00")
+                final_payable = ZERO_AMOUNT
         
         status_val = Booking.BookingStatus.REQUESTED
 
@@ -1015,15 +1017,13 @@ class HomeServiceBookingCreateSerializer(serializers.Serializer):
     @transaction.atomic
     def create(self, validated_data):
         """Create the home service booking."""
-        from decimal import Decimal
-
         request = self.context.get("request")
         customer = request.user
 
         home_service = validated_data["home_service"]
         extra_minutes = int(validated_data.get("extra_minutes", 0))
-        price_for_extra = Decimal(str(validated_data.get("price_for_extra_minutes", 0)))
-        discount_amount = Decimal(str(validated_data.get("discount_amount", 0)))
+        price_for_extra = to_decimal(validated_data.get("price_for_extra_minutes"))
+        discount_amount = to_decimal(validated_data.get("discount_amount"))
 
         # Total duration = service duration + extra minutes
         total_duration = home_service.duration_minutes + extra_minutes
@@ -1036,8 +1036,8 @@ class HomeServiceBookingCreateSerializer(serializers.Serializer):
         final_price = validated_data.get("total_price")
         if final_price is None:
             final_price = subtotal - discount_amount
-            if final_price < Decimal("0.00"):
-                final_price = Decimal("0.00")
+            if final_price < ZERO_AMOUNT:
+                final_price = ZERO_AMOUNT
 
         booking = HomeServiceBooking.objects.create(
             customer=customer,
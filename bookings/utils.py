@@ -9,6 +9,7 @@ never broken.
 
 from collections import defaultdict
 from datetime import timedelta
+from decimal import Decimal
 
 from django.db.models import Q
 
@@ -16,6 +17,9 @@ from bookings.models import TimeSlot
 from spacenter.models import ServiceArrangement
 
 
+ZERO_AMOUNT = Decimal("0.00")
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -229,6 +233,21 @@ def calculate_service_availability(service, spa_center, date_from, date_to):
     }
 
 
+def to_decimal(value):
+    """
+    Return a monetary input as a ``Decimal``.
+
+    Validated ``DecimalField`` values are already ``Decimal`` and are returned
+    as-is; only field defaults (``0``) and other raw values go through
+    ``str()``. ``None`` is treated as zero.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if value is None:
+        return ZERO_AMOUNT
+    return Decimal(str(value))
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
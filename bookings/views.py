@@ -11,20 +11,24 @@ from datetime import datetime, timedelta
 
 from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Prefetch, Q
+from django.db.models import F, Prefetch, Q
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from rest_framework import generics, permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from config.cache_utils import (
     CACHE_TIMEOUT,
     SERVICE_ARRANGEMENTS_CACHE_PREFIX,
+    SPA_PRODUCT_CACHE_PREFIX,
     build_id_cache_key,
+    invalidate_model_cache,
 )
 
-from spacenter.models import Service, SpaCenter, ServiceArrangement
+from spacenter.models import BaseProduct, Service, SpaCenter, ServiceArrangement, SpaProduct
 
 from .models import Booking, TimeSlot, ProductOrder, OrderItem, HomeServiceBooking
 from .serializers import (
@@ -40,6 +44,7 @@ from .serializers import (
     HomeServiceBookingSerializer,
     HomeServiceBookingCreateSerializer,
 )
+from .utils import to_decimal
 
 logger = logging.getLogger(__name__)
 
@@ -563,8 +568,16 @@ class ProductOrderViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         user = self.request.user
         if hasattr(user, "employee_profile") or user.is_staff:
-             return ProductOrder.objects.all()
-        return ProductOrder.objects.filter(user=user)
+            queryset = ProductOrder.objects.all()
+        else:
+            queryset = ProductOrder.objects.filter(user=user)
+
+        return queryset.prefetch_related(
+            Prefetch(
+                "items",
+                queryset=OrderItem.objects.select_related("product__product"),
+            ),
+        )
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -582,13 +595,11 @@ class ProductOrderViewSet(viewsets.ModelViewSet):
         shipping_address = data.get("shipping_address", "")
         contact_number = data.get("contact_number", "")
         
-        from decimal import Decimal
-        
         # Calculate totals
         calculated_subtotal = sum(item["product"].current_price * item["quantity"] for item in items_data)
         subtotal = data.get("subtotal") or calculated_subtotal
         
-        delivery_charge = Decimal(str(data.get("delivery_charge", 0) or 0))
+        delivery_charge = to_decimal(data.get("delivery_charge"))
         
         # final_amount = subtotal + delivery_charge
         final_amount = subtotal + delivery_charge
@@ -619,10 +630,23 @@ class ProductOrderViewSet(viewsets.ModelViewSet):
                 total_price=unit_price * quantity
             )
             
-            # Deduct stock
-            product.quantity -= quantity
-            product.reserved_quantity = max(0, product.reserved_quantity - quantity)
-            product.save()
+            # Deduct stock atomically; the guard fails if a concurrent order
+            # took the stock after validation.
+            deducted = SpaProduct.objects.filter(
+                pk=product.pk,
+                quantity__gte=F("reserved_quantity") + quantity,
+            ).update(
+                quantity=F("quantity") - quantity,
+                reserved_quantity=Greatest(F("reserved_quantity") - quantity, 0),
+                updated_at=timezone.now(),
+            )
+            if not deducted:
+                raise ValidationError(
+                    {"items": [f"Not enough stock for {product.product.name}."]}
+                )
+
+        BaseProduct.refresh_stock_totals({item["product"].product_id for item in items_data})
+        invalidate_model_cache(SPA_PRODUCT_CACHE_PREFIX)
 
         # Return response with calculated prices
         order_data = ProductOrderSerializer(order).data
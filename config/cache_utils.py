@@ -9,7 +9,9 @@ Uses Django's cache framework (backed by Redis).
 import hashlib
 import logging
 
+from django.conf import settings
 from django.core.cache import cache
+from django.utils.translation import get_language
 from rest_framework.response import Response
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,13 @@ HOME_SERVICE_CACHE_PREFIX = "home_service_list"
 SERVICE_ARRANGEMENTS_CACHE_PREFIX = "service_arrangements"
 BRANCH_SERVICES_CACHE_PREFIX = "branch_services"
 
+# Per-user cache prefixes (short TTL, invalidated per user)
+LOYALTY_STATUS_CACHE_PREFIX = "loyalty_status"
+
+# Negative lookup cache for unknown public gift card tokens. Tokens are
+# random and never reused, so entries only expire and are not invalidated.
+GIFT_CARD_MISS_CACHE_PREFIX = "gift_card_miss"
+
 # All prefixes for bulk invalidation
 ALL_CACHE_PREFIXES = [
     COUNTRY_CACHE_PREFIX,
@@ -44,11 +53,18 @@ ALL_CACHE_PREFIXES = [
     HOME_SERVICE_CACHE_PREFIX,
     SERVICE_ARRANGEMENTS_CACHE_PREFIX,
     BRANCH_SERVICES_CACHE_PREFIX,
+    LOYALTY_STATUS_CACHE_PREFIX,
 ]
 
 # Default cache timeout (15 minutes)
 CACHE_TIMEOUT = 900
 
+# Per-user data changes more often, so it is kept for a shorter time
+USER_CACHE_TIMEOUT = 60
+
+# Unknown gift card tokens are remembered just long enough to absorb bursts
+GIFT_CARD_MISS_CACHE_TIMEOUT = 10
+
 
 # ============================================================================
 # Cache Key Builders
@@ -100,6 +116,16 @@ def build_id_cache_key(prefix, identifier, request):
     return f"{prefix}:{identifier}:{key_hash}"
 
 
+def build_user_cache_key(prefix, user_id):
+    """
+    Build a cache key for a per-user endpoint.
+
+    Keyed on the user id and the active language only (no hash), so
+    ``invalidate_user_cache`` can delete every variant for a user directly.
+    """
+    return f"{prefix}:{user_id}:{get_language() or settings.LANGUAGE_CODE}"
+
+
 # ============================================================================
 # Cache Invalidation
 # ============================================================================
@@ -119,6 +145,20 @@ def invalidate_model_cache(prefix):
         logger.warning("Failed to clear cache: %s", e)
 
 
+def invalidate_user_cache(prefix, user_id):
+    """
+    Invalidate a user's cached entries for *prefix*.
+
+    Deletes the key built by ``build_user_cache_key`` for every configured
+    language.
+    """
+    keys = [f"{prefix}:{user_id}:{code}" for code, _ in settings.LANGUAGES]
+    try:
+        cache.delete_many(keys)
+    except Exception as e:
+        logger.warning("Failed to invalidate %s cache for user %s: %s", prefix, user_id, e)
+
+
 def invalidate_all_caches():
     """
     Invalidate all API list caches by clearing the entire cache store.
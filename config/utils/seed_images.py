@@ -0,0 +1,237 @@
+"""
+Image download helpers for the seed management commands.
+
+All downloads go through one shared ``requests.Session`` so HTTPS
+keep-alive is reused across the handful of CDN hosts the seed data
+points at, and ``download_images_bulk`` fetches a batch of URLs in
+parallel instead of one request at a time.
+
+Downloaded images are kept under ``.cache/seed_images`` keyed by the
+SHA-1 of their URL, so reseeding a local database does not fetch the
+same static URLs again. Responses are streamed in chunks into the
+returned buffer and the cache file at the same time.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(settings.BASE_DIR) / ".cache" / "seed_images"
+
+_CHUNK_SIZE = 64 * 1024
+
+# Longest side of the WebP thumbnails written in --thumbs mode
+THUMBNAIL_SIZE = 400
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the shared download session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = "Mozilla/5.0"
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(total=2, backoff_factor=0.2),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.bin"
+
+
+def _read_cache(url: str) -> Optional[bytes]:
+    try:
+        path = _cache_path(url)
+        if path.stat().st_size > 0:
+            return path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+class _CacheWriter:
+    """
+    Stream a download into a temp file next to its cache entry.
+
+    ``commit`` moves the file into place atomically; ``discard`` drops
+    it. Cache I/O errors only disable caching for this download.
+    """
+
+    def __init__(self, url: str):
+        self.path = _cache_path(url)
+        self.fh = None
+        self.tmp = None
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            fd, self.tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            self.fh = os.fdopen(fd, "wb")
+        except OSError:
+            self.discard()
+
+    def write(self, chunk: bytes) -> None:
+        if self.fh is None:
+            return
+        try:
+            self.fh.write(chunk)
+        except OSError:
+            self.discard()
+
+    def commit(self) -> None:
+        if self.fh is None:
+            return
+        try:
+            self.fh.close()
+            self.fh = None
+            os.replace(self.tmp, self.path)
+        except OSError:
+            self.discard()
+
+    def discard(self) -> None:
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+        if self.tmp is not None:
+            try:
+                os.unlink(self.tmp)
+            except OSError:
+                pass
+            self.tmp = None
+
+
+def download_image(
+    url: str, timeout: int = 15, use_cache: bool = True, refresh: bool = False
+) -> Optional[bytes]:
+    """
+    Download an image from a URL. Returns bytes or None on failure.
+
+    With ``refresh`` the cached copy is ignored but still replaced by the
+    new download.
+    """
+    if use_cache and not refresh:
+        data = _read_cache(url)
+        if data:
+            return data
+
+    cache = _CacheWriter(url) if use_cache else None
+    try:
+        with get_session().get(url, timeout=timeout, stream=True) as resp:
+            resp.raise_for_status()
+            buf = io.BytesIO()
+            for chunk in resp.iter_content(chunk_size=_CHUNK_SIZE):
+                buf.write(chunk)
+                if cache:
+                    cache.write(chunk)
+    except Exception:
+        if cache:
+            cache.discard()
+        return None
+
+    data = buf.getvalue()
+    if cache:
+        if data:
+            cache.commit()
+        else:
+            cache.discard()
+    return data
+
+
+def prefetch_images(
+    urls: Iterable[str], max_workers: int = 16, timeout: int = 15, refresh: bool = False
+) -> int:
+    """
+    Download the URLs that are not in the disk cache yet.
+
+    Lets a caller do the network work up front, e.g. before opening a
+    transaction, so later ``download_image`` calls are cache reads. With
+    ``refresh`` every URL is downloaded again and its cache entry
+    replaced. Returns the number of URLs that were downloaded successfully;
+    failed ones are logged by ``download_images_bulk``.
+    """
+    missing = [u for u in dict.fromkeys(urls) if u and (refresh or not _cache_path(u).is_file())]
+    if not missing:
+        return 0
+    images = download_images_bulk(missing, max_workers=max_workers, timeout=timeout, refresh=refresh)
+    return sum(1 for data in images.values() if data)
+
+
+def make_thumbnail(data: bytes, max_size: int = THUMBNAIL_SIZE) -> Optional[bytes]:
+    """
+    Re-encode image bytes as a WebP no larger than ``max_size`` px on either side.
+
+    Returns None if the image cannot be decoded.
+    """
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as img:
+            img.thumbnail((max_size, max_size))
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGB")
+            out = io.BytesIO()
+            img.save(out, format="WEBP", quality=80)
+            return out.getvalue()
+    except Exception:
+        return None
+
+
+def download_images_bulk(
+    urls: Iterable[str],
+    max_workers: int = 16,
+    timeout: int = 15,
+    use_cache: bool = True,
+    thumbs: bool = False,
+    refresh: bool = False,
+) -> dict[str, Optional[bytes]]:
+    """
+    Download several images concurrently.
+
+    Duplicate URLs are fetched once. With ``thumbs`` each image is turned
+    into a WebP thumbnail on the same worker thread; the cache keeps the
+    original. ``refresh`` bypasses cached copies as in ``download_image``.
+    Returns a dict mapping each URL to its bytes, or None if
+    that download (or thumbnail) failed. Failed URLs are logged.
+    """
+    unique = list(dict.fromkeys(u for u in urls if u))
+    if not unique:
+        return {}
+
+    def fetch(url):
+        data = download_image(url, timeout, use_cache, refresh)
+        if data and thumbs:
+            data = make_thumbnail(data)
+        return data
+
+    workers = min(max_workers, len(unique))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        images = dict(zip(unique, executor.map(fetch, unique)))
+
+    failed = [url for url, data in images.items() if not data]
+    if failed:
+        logger.warning(
+            "Failed to fetch %d of %d seed image(s): %s",
+            len(failed), len(unique), ", ".join(failed),
+        )
+    return images
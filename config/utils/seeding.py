@@ -0,0 +1,39 @@
+"""
+Helpers shared by the seed management commands.
+"""
+
+from contextlib import contextmanager
+
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
+
+_DELETE_SIGNALS = (pre_delete, post_delete, m2m_changed)
+
+
+@contextmanager
+def muted_delete_signals():
+    """
+    Disconnect every delete-related receiver for the duration of the block.
+
+    With no pre/post_delete or m2m_changed listeners, Django's delete
+    collector can issue one DELETE per table instead of loading each row
+    to dispatch signals, and history/cache receivers stop firing per row.
+
+    Only use this around bulk seed clears. The receivers are process-wide,
+    so nothing else should be deleting while the block runs, and the
+    caller is responsible for the side effects the receivers would have
+    had (e.g. call ``invalidate_all_caches()`` afterwards). Anyone adding
+    a delete receiver with side effects beyond caching or history should
+    check the seed ``--clear`` paths that use this.
+    """
+    saved = [(signal, signal.receivers) for signal in _DELETE_SIGNALS]
+    try:
+        for signal, _ in saved:
+            with signal.lock:
+                signal.receivers = []
+                signal.sender_receivers_cache.clear()
+        yield
+    finally:
+        for signal, receivers in saved:
+            with signal.lock:
+                signal.receivers = receivers
+                signal.sender_receivers_cache.clear()
@@ -101,3 +101,36 @@ def send_sms_async(phone_number: str, message: str, sender: str = None):
     logger.info(f"Spawned thread for SMS to {phone_number}")
     return True
 
+
+def send_sms_batch(messages, sender: str = None) -> list:
+    """
+    Send several SMS messages one after another.
+
+    Args:
+        messages: Iterable of ``(phone_number, message)`` pairs.
+        sender: Alphanumeric Sender ID passed through to ``send_sms``.
+
+    Returns:
+        A list of ``send_sms`` result dicts, in input order.
+    """
+    return [send_sms(phone_number, message, sender) for phone_number, message in messages]
+
+
+def send_sms_batch_async(messages, sender: str = None):
+    """
+    Asynchronously send a batch of SMS messages from a single thread.
+
+    Bulk senders use this instead of calling ``send_sms_async`` per message,
+    so a batch costs one thread rather than one per recipient.
+    """
+    messages = list(messages)
+    if not messages:
+        return False
+    thread = threading.Thread(
+        target=send_sms_batch,
+        args=(messages, sender),
+        daemon=True,
+    )
+    thread.start()
+    logger.info(f"Spawned thread for {len(messages)} SMS messages")
+    return True
@@ -377,7 +377,7 @@ class StripeWebhookView(APIView):
         # Send SMS to recipient
         try:
             from promotions.tasks import send_gift_card_sms
-            send_gift_card_sms(str(gift_card.id))
+            send_gift_card_sms(str(gift_card.id), gift_card=gift_card)
         except Exception as e:
             logger.error(f"Failed to send gift card SMS for {gift_card_id}: {e}")
 
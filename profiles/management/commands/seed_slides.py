@@ -3,11 +3,11 @@ Seed slides for the landing page carousel with Arabic translations and real imag
 Images are downloaded from Pexels and saved via Django's storage backend (S3 in production, local in dev).
 """
 
-import urllib.request
-
 from django.core.files.base import ContentFile
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
+from config.utils.seed_images import download_images_bulk
 from profiles.models import Slide
 
 
@@ -56,27 +56,25 @@ SLIDES = [
 ]
 
 
-def _download_image(url, timeout=15):
-    """Download an image from a URL. Returns bytes or None on failure."""
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read()
-    except Exception:
-        return None
-
-
 class Command(BaseCommand):
     help = "Seed slides for the landing page carousel with real images"
+    # Every URL this command may download; seed_all prefetches them
+    seed_image_urls = [s["image_url"] for s in SLIDES if s.get("image_url")]
 
     def add_arguments(self, parser):
         parser.add_argument("--clear", action="store_true", help="Clear existing slides before seeding")
+        parser.add_argument("--no-image-cache", action="store_true", help="Re-download images instead of using the local image cache")
+        parser.add_argument("--thumbs", action="store_true", help="Store downloaded images as 400px WebP thumbnails instead of the originals")
 
     def handle(self, *args, **options):
+        self.use_image_cache = not options["no_image_cache"]
+        self.thumbs = options["thumbs"]
+        self.image_ext = "webp" if self.thumbs else "jpg"
         if options["clear"]:
             self.stdout.write("Clearing existing slides...")
             Slide.objects.all().delete()
 
+        missing_images = []
         for i, s in enumerate(SLIDES, start=1):
             slide, created = Slide.objects.update_or_create(
                 title_en=s["title_en"],
@@ -92,18 +90,33 @@ class Command(BaseCommand):
                 },
             )
 
-            # Download and save image if none exists
             if not slide.image and s.get("image_url"):
-                self.stdout.write(f"    Downloading image for: {slide.title}...")
-                img_data = _download_image(s["image_url"])
-                if img_data:
-                    fname = f"slide_{slide.id}.jpg"
-                    slide.image.save(fname, ContentFile(img_data), save=True)
-                    self.stdout.write(f"    📷 Image saved for: {slide.title}")
-                else:
-                    self.stdout.write(self.style.WARNING(f"    ⚠ Download failed for: {slide.title}"))
+                missing_images.append((slide, s["image_url"]))
 
             status = "Created" if created else "Updated"
             self.stdout.write(self.style.SUCCESS(f"  {status}: {slide.title}"))
 
+        # Download and save images for slides that have none
+        if missing_images:
+            self.stdout.write(f"    Downloading {len(missing_images)} slide image(s)...")
+        images = download_images_bulk(
+            [url for _, url in missing_images],
+            use_cache=self.use_image_cache,
+            thumbs=self.thumbs,
+        )
+        now = timezone.now()
+        with_images = []
+        for slide, img_url in missing_images:
+            img_data = images.get(img_url)
+            if img_data:
+                fname = f"slide_{slide.id}.{self.image_ext}"
+                slide.image.save(fname, ContentFile(img_data), save=False)
+                slide.updated_at = now
+                with_images.append(slide)
+                self.stdout.write(f"    📷 Image saved for: {slide.title}")
+            else:
+                self.stdout.write(self.style.WARNING(f"    ⚠ Download failed for: {slide.title}"))
+        if with_images:
+            Slide.objects.bulk_update(with_images, ["image", "updated_at"])
+
         self.stdout.write(self.style.SUCCESS(f"\n✅ Slides seeding complete! Total: {len(SLIDES)}"))
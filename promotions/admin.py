@@ -432,10 +432,10 @@ class GiftCardAdmin(SpaCenterRestrictedAdminMixin, SimpleHistoryAdmin):
 
     @admin.action(description="Resend SMS for selected gift cards")
     def resend_sms(self, request, queryset):
-        from .tasks import send_gift_card_sms
+        from .tasks import send_gift_card_sms_batch
 
-        count = 0
-        for gift_card in queryset.filter(status=GiftCard.GiftCardStatus.ACTIVE):
-            send_gift_card_sms(str(gift_card.id))
-            count += 1
+        active_gift_cards = queryset.filter(
+            status=GiftCard.GiftCardStatus.ACTIVE,
+        ).select_related("sender", "service")
+        count = send_gift_card_sms_batch(active_gift_cards)
         self.message_user(request, f"SMS queued for {count} gift cards.")
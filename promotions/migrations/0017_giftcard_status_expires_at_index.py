@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("promotions", "0016_alter_giftcard_status_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="giftcard",
+            index=models.Index(
+                fields=["status", "expires_at"], name="promotions__status_0e41b3_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("promotions", "0017_giftcard_status_expires_at_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="giftcard",
+            index=models.Index(
+                fields=["recipient", "created_at"],
+                name="promotions__recipie_a342ac_idx",
+            ),
+        ),
+    ]
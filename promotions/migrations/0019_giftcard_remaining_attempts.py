@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:14
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("promotions", "0018_giftcard_recipient_created_at_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="giftcard",
+            name="promotions__status_0e41b3_idx",
+        ),
+        migrations.AddField(
+            model_name="giftcard",
+            name="remaining_attempts",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    models.F("max_attempts"), "-", models.F("failed_attempts")
+                ),
+                help_text="Computed by the database from max and failed attempts",
+                output_field=models.IntegerField(),
+                verbose_name="remaining redemption attempts",
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalgiftcard",
+            name="remaining_attempts",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    models.F("max_attempts"), "-", models.F("failed_attempts")
+                ),
+                help_text="Computed by the database from max and failed attempts",
+                output_field=models.IntegerField(),
+                verbose_name="remaining redemption attempts",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="giftcard",
+            index=models.Index(
+                fields=["status", "expires_at", "remaining_attempts"],
+                name="promotions__status_1d3baf_idx",
+            ),
+        ),
+    ]
@@ -312,6 +312,17 @@ def generate_public_token():
     return uuid.uuid4().hex[:16]
 
 
+_URLSAFE_PUNCTUATION = str.maketrans("", "", "-_")
+
+
+def generate_temporary_password(length=6):
+    """Generate an alphanumeric temporary password for auto-created recipients."""
+    password = ""
+    while len(password) < length:
+        password += secrets.token_urlsafe(length).translate(_URLSAFE_PUNCTUATION)
+    return password[:length]
+
+
 class GiftCard(models.Model):
     """
     Gift Card – Gift a service to someone via their phone number.
@@ -530,6 +541,13 @@ class GiftCard(models.Model):
         _("max redemption attempts"),
         default=5,
     )
+    remaining_attempts = models.GeneratedField(
+        expression=models.F("max_attempts") - models.F("failed_attempts"),
+        output_field=models.IntegerField(),
+        db_persist=True,
+        verbose_name=_("remaining redemption attempts"),
+        help_text=_("Computed by the database from max and failed attempts"),
+    )
 
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
@@ -543,9 +561,11 @@ class GiftCard(models.Model):
         indexes = [
             models.Index(fields=["sender", "status"]),
             models.Index(fields=["recipient", "status"]),
+            models.Index(fields=["recipient", "created_at"]),
             models.Index(fields=["recipient_phone", "status"]),
             models.Index(fields=["public_token"]),
             models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["status", "expires_at", "remaining_attempts"]),
         ]
 
     def __str__(self):
@@ -582,10 +602,35 @@ class GiftCard(models.Model):
         base_url = getattr(settings, "SITE_BASE_URL", "http://localhost:8000")
         return f"{base_url}/gift-cards/public/{self.public_token}/"
 
-    def record_failed_attempt(self):
-        """Record a failed redemption attempt."""
-        self.failed_attempts += 1
-        self.save(update_fields=["failed_attempts", "updated_at"])
+    def record_failed_attempt(self, extra_update_fields=()):
+        """
+        Record a failed redemption attempt.
+
+        The counter is incremented in SQL, and only while it is below
+        ``max_attempts``, so concurrent wrong guesses can neither overwrite
+        each other nor push it past the limit. Fields listed in
+        ``extra_update_fields`` are written in the same UPDATE. The history
+        row that ``save()`` would have written is added explicitly.
+
+        Returns:
+            bool: False if the card was already locked by another attempt.
+        """
+        recorded = GiftCard.objects.filter(
+            pk=self.pk,
+            failed_attempts__lt=models.F("max_attempts"),
+        ).update(
+            failed_attempts=models.F("failed_attempts") + 1,
+            updated_at=timezone.now(),
+            **{field: getattr(self, field) for field in extra_update_fields},
+        )
+        if not recorded and extra_update_fields:
+            self.save(update_fields=[*extra_update_fields, "updated_at"])
+        self.refresh_from_db(
+            fields=["failed_attempts", "remaining_attempts", "updated_at"],
+        )
+        if recorded:
+            GiftCard.history.bulk_history_create([self], update=True)
+        return bool(recorded)
 
     def activate(self):
         """Activate the gift card after successful payment."""
@@ -603,18 +648,23 @@ class GiftCard(models.Model):
         """
         return
 
-    def redeem(self, secret_code, redeemed_by_user=None):
+    def redeem(self, secret_code, redeemed_by_user=None, extra_update_fields=()):
         """
         Attempt to redeem the gift card with a secret code.
 
         Args:
             secret_code: The 6-digit code to verify.
             redeemed_by_user: Optional User instance who is redeeming.
+            extra_update_fields: Fields the caller already changed on this
+                instance. They are saved whatever the outcome, in the same
+                UPDATE as the redemption or failed attempt.
 
         Returns:
             (success, error_message) tuple.
         """
         if not self.is_redeemable:
+            if extra_update_fields:
+                self.save(update_fields=[*extra_update_fields, "updated_at"])
             if self.is_expired:
                 return False, _("This gift card has expired.")
             if self.is_locked:
@@ -622,7 +672,7 @@ class GiftCard(models.Model):
             return False, _("This gift card is not available for redemption.")
 
         if self.secret_code != secret_code:
-            self.record_failed_attempt()
+            self.record_failed_attempt(extra_update_fields)
             remaining = self.max_attempts - self.failed_attempts
             if remaining <= 0:
                 return False, _(
@@ -638,6 +688,7 @@ class GiftCard(models.Model):
         self.redeemed_by = redeemed_by_user or self.recipient
         self.save(update_fields=[
             "status", "redeemed_at", "redeemed_by", "updated_at",
+            *extra_update_fields,
         ])
         return True, None
 
@@ -4,15 +4,38 @@ Promotions (Gift Cards & Loyalty Program) Serializers.
 
 from decimal import Decimal
 
+import phonenumbers
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 from django.utils import timezone
 from rest_framework import serializers
 
+from bookings.models import Booking, TimeSlot
+from bookings.serializers import BookingSerializer
+from spacenter.models import AddOnService, Service, ServiceArrangement, SpaCenter
+
 from .models import (
     GiftCard,
     LoyaltyReward,
     LoyaltyTracker,
 )
+from .utils import get_gift_card_by_token, get_or_create_recipient_user
+
+
+def _primary_image_url(images, request=None):
+    """
+    Return the URL of the primary image in *images* (or the first available).
+
+    Iterates ``images.all()`` so a prefetched relation is served from memory
+    instead of issuing two queries per serialized row.
+    """
+    images = images.all()
+    image = next((img for img in images if img.is_primary), None) or next(iter(images), None)
+    if image and image.image:
+        if request:
+            return request.build_absolute_uri(image.image.url)
+        return image.image.url
+    return None
 
 
 # =============================================================================
@@ -62,16 +85,7 @@ class LoyaltyTrackerSerializer(serializers.ModelSerializer):
 
     def get_service_image(self, obj):
         """Return the URL of the primary service image (or first available)."""
-        image = (
-            obj.service.images.filter(is_primary=True).first()
-            or obj.service.images.first()
-        )
-        if image and image.image:
-            request = self.context.get("request")
-            if request:
-                return request.build_absolute_uri(image.image.url)
-            return image.image.url
-        return None
+        return _primary_image_url(obj.service.images, self.context.get("request"))
 
 
 class LoyaltyRewardSerializer(serializers.ModelSerializer):
@@ -116,16 +130,7 @@ class LoyaltyRewardSerializer(serializers.ModelSerializer):
 
     def get_service_image(self, obj):
         """Return the URL of the primary service image (or first available)."""
-        image = (
-            obj.service.images.filter(is_primary=True).first()
-            or obj.service.images.first()
-        )
-        if image and image.image:
-            request = self.context.get("request")
-            if request:
-                return request.build_absolute_uri(image.image.url)
-            return image.image.url
-        return None
+        return _primary_image_url(obj.service.images, self.context.get("request"))
 
 
 class LoyaltyRedeemBookingSerializer(serializers.Serializer):
@@ -150,36 +155,38 @@ class LoyaltyRedeemBookingSerializer(serializers.Serializer):
         required=False, allow_blank=True, default=""
     )
 
-    def validate_reward_id(self, value):
-        """Ensure the reward exists, belongs to the current user, and is available."""
+    def _get_available_reward(self, reward_id):
+        """Fetch the reward once, ensuring it belongs to the current user and is available."""
         request = self.context.get("request")
         try:
             reward = LoyaltyReward.objects.select_related(
-                "service", "service_arrangement", "service__spa_center",
-            ).get(id=value)
+                "service", "service_arrangement",
+                "service__spa_center", "service__spa_center__city",
+                "service__spa_center__country", "service_arrangement__spa_center",
+            ).get(id=reward_id)
         except LoyaltyReward.DoesNotExist:
-            raise serializers.ValidationError("Loyalty reward not found.")
+            raise serializers.ValidationError({"reward_id": "Loyalty reward not found."})
 
         if request and request.user.is_authenticated:
-            if reward.customer != request.user:
-                raise serializers.ValidationError("This reward does not belong to you.")
+            if reward.customer_id != request.user.pk:
+                raise serializers.ValidationError({"reward_id": "This reward does not belong to you."})
 
         if not reward.is_available:
             if reward.status == LoyaltyReward.RewardStatus.REDEEMED:
-                raise serializers.ValidationError("This reward has already been redeemed.")
+                message = "This reward has already been redeemed."
             elif reward.status == LoyaltyReward.RewardStatus.EXPIRED:
-                raise serializers.ValidationError("This reward has expired.")
+                message = "This reward has expired."
             elif reward.status == LoyaltyReward.RewardStatus.CANCELLED:
-                raise serializers.ValidationError("This reward has been cancelled.")
+                message = "This reward has been cancelled."
             else:
-                raise serializers.ValidationError("This reward is no longer available.")
+                message = "This reward is no longer available."
+            raise serializers.ValidationError({"reward_id": message})
 
-        return value
+        return reward
 
     def validate_date(self, value):
         """Validate that the date is not in the past."""
-        from django.utils import timezone as tz
-        today = tz.now().date()
+        today = timezone.now().date()
         if value < today:
             raise serializers.ValidationError("Cannot book for a past date.")
         return value
@@ -187,16 +194,12 @@ class LoyaltyRedeemBookingSerializer(serializers.Serializer):
     def validate(self, attrs):
         """
         Cross-field validation:
+        - Fetch the reward once and check ownership and availability
         - Resolve service, arrangement, spa_center from the reward
         - Calculate end time
         - Check time slot availability
         """
-        from bookings.models import Booking, TimeSlot
-
-        reward = LoyaltyReward.objects.select_related(
-            "service", "service_arrangement",
-            "service__spa_center", "service_arrangement__spa_center",
-        ).get(id=attrs["reward_id"])
+        reward = self._get_available_reward(attrs["reward_id"])
 
         service = reward.service
         arrangement = reward.service_arrangement
@@ -237,14 +240,16 @@ class LoyaltyRedeemBookingSerializer(serializers.Serializer):
             })
 
         # Check availability
-        overlapping_count = TimeSlot.objects.filter(
+        # Each arrangement is a single room (capacity is always 1), so any
+        # overlapping slot makes it unavailable.
+        is_booked = TimeSlot.objects.filter(
             arrangement=arrangement,
             date=date,
             start_time__lt=end_time,
             end_time__gt=start_time,
-        ).count()
+        ).exists()
 
-        if overlapping_count >= arrangement.capacity:
+        if is_booked:
             raise serializers.ValidationError({
                 "start_time": "Selected arrangement has no available space for this time."
             })
@@ -262,9 +267,6 @@ class LoyaltyRedeemBookingSerializer(serializers.Serializer):
     @transaction.atomic
     def create(self, validated_data):
         """Create a free booking and redeem the reward atomically."""
-        from bookings.models import Booking, TimeSlot
-        from decimal import Decimal
-
         request = self.context.get("request")
         customer = request.user
 
@@ -354,7 +356,6 @@ class LoyaltyRedeemBookingSerializer(serializers.Serializer):
 
     def to_representation(self, instance):
         """Return full booking details after creation."""
-        from bookings.serializers import BookingSerializer
         return BookingSerializer(instance).data
 
 
@@ -428,24 +429,6 @@ class GiftCardCreateSerializer(serializers.ModelSerializer):
             "expires_at",
         ]
 
-    def validate_service_id(self, value):
-        """Ensure the service exists and is active."""
-        from spacenter.models import Service
-        try:
-            Service.objects.get(id=value, is_active=True)
-        except Service.DoesNotExist:
-            raise serializers.ValidationError("Service not found or is inactive.")
-        return value
-
-    def validate_spa_center_id(self, value):
-        """Ensure the spa center exists and is active."""
-        from spacenter.models import SpaCenter
-        try:
-            SpaCenter.objects.get(id=value, is_active=True)
-        except SpaCenter.DoesNotExist:
-            raise serializers.ValidationError("Spa center not found or is inactive.")
-        return value
-
     def validate_recipient_phone(self, value):
         """
         Normalize phone number by adding '+' if missing and validate it.
@@ -454,7 +437,6 @@ class GiftCardCreateSerializer(serializers.ModelSerializer):
         if not phone_str.startswith("+"):
             phone_str = f"+{phone_str}"
 
-        import phonenumbers
         try:
             # We use None as region because we expect E.164 (with country code)
             # or we assume the prepended + makes it globally parsable if it has country code.
@@ -469,53 +451,66 @@ class GiftCardCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Please provide a valid mobile number with country code.")
 
     def validate(self, attrs):
-        """Ensure arrangement belongs to the selected service and spa center offers the service."""
-        service_id = attrs.get("service_id")
+        """
+        Ensure arrangement belongs to the selected service and spa center offers the service.
+
+        The resolved instances are stashed in ``attrs`` so ``create`` does not
+        fetch them again.
+        """
         spa_center_id = attrs.get("spa_center_id")
         arrangement_id = attrs.get("service_arrangement_id")
         add_on_service_id = attrs.get("add_on_service_id")
 
+        service = Service.objects.filter(id=attrs.get("service_id"), is_active=True).first()
+        if service is None:
+            raise serializers.ValidationError({
+                "service_id": "Service not found or is inactive."
+            })
+
+        spa_center = SpaCenter.objects.filter(id=spa_center_id, is_active=True).first()
+        if spa_center is None:
+            raise serializers.ValidationError({
+                "spa_center_id": "Spa center not found or is inactive."
+            })
+
         # Verify the service belongs to the spa center
-        from spacenter.models import Service
-        try:
-            service = Service.objects.get(id=service_id)
-            if str(service.spa_center_id) != str(spa_center_id):
-                raise serializers.ValidationError({
-                    "spa_center_id": "This spa center does not offer the selected service."
-                })
-        except Service.DoesNotExist:
-            pass  # Already validated above
+        if service.spa_center_id != spa_center.id:
+            raise serializers.ValidationError({
+                "spa_center_id": "This spa center does not offer the selected service."
+            })
 
         # Verify arrangement belongs to the same spa center and allows the service
-        from spacenter.models import ServiceArrangement
-        try:
-            arrangement = ServiceArrangement.objects.get(id=arrangement_id)
-            if str(arrangement.spa_center_id) != str(spa_center_id):
-                raise serializers.ValidationError({
-                    "service_arrangement_id": "This arrangement does not belong to the selected spa center."
-                })
-            
-            if not arrangement.is_service_allowed(service):
-                raise serializers.ValidationError({
-                    "service_arrangement_id": "This service is not allowed in the selected arrangement."
-                })
-        except ServiceArrangement.DoesNotExist:
-            pass  # Already validated above
+        arrangement = ServiceArrangement.objects.filter(id=arrangement_id).first()
+        if arrangement is None:
+            raise serializers.ValidationError({
+                "service_arrangement_id": "Service arrangement not found."
+            })
+        if arrangement.spa_center_id != spa_center.id:
+            raise serializers.ValidationError({
+                "service_arrangement_id": "This arrangement does not belong to the selected spa center."
+            })
+        if not arrangement.is_service_allowed(service):
+            raise serializers.ValidationError({
+                "service_arrangement_id": "This service is not allowed in the selected arrangement."
+            })
 
         # Verify add-on service belongs to the service
+        add_on = None
         if add_on_service_id:
-            from spacenter.models import AddOnService
-            try:
-                add_on = AddOnService.objects.get(id=add_on_service_id)
-                if not service.add_on_services.filter(id=add_on_service_id).exists():
-                    raise serializers.ValidationError({
-                        "add_on_service_id": "This add-on service is not available for the selected service."
-                    })
-            except AddOnService.DoesNotExist:
+            add_on = AddOnService.objects.filter(id=add_on_service_id).first()
+            if add_on is None:
                 raise serializers.ValidationError({
                     "add_on_service_id": "Add-on service not found."
                 })
+            if not service.add_on_services.filter(id=add_on_service_id).exists():
+                raise serializers.ValidationError({
+                    "add_on_service_id": "This add-on service is not available for the selected service."
+                })
 
+        attrs["service"] = service
+        attrs["spa_center"] = spa_center
+        attrs["service_arrangement"] = arrangement
+        attrs["add_on_service"] = add_on
         return attrs
 
     def create(self, validated_data):
@@ -523,51 +518,17 @@ class GiftCardCreateSerializer(serializers.ModelSerializer):
 
         Initial status is always PENDING_PAYMENT.
         """
-        from accounts.models import User, UserType
-        from spacenter.models import Service, ServiceArrangement, SpaCenter, AddOnService
-
-        service_id = validated_data.pop("service_id")
-        spa_center_id = validated_data.pop("spa_center_id")
-        arrangement_id = validated_data.pop("service_arrangement_id")
-        add_on_service_id = validated_data.pop("add_on_service_id", None)
-        extra_minutes = validated_data.pop("extra_minutes", 0)
-        total_duration = validated_data.pop("total_duration")
-
-        service = Service.objects.get(id=service_id)
-        spa_center = SpaCenter.objects.get(id=spa_center_id)
-        arrangement = ServiceArrangement.objects.get(id=arrangement_id)
-        add_on_service = AddOnService.objects.get(id=add_on_service_id) if add_on_service_id else None
+        service = validated_data["service"]
+        spa_center = validated_data["spa_center"]
+        arrangement = validated_data["service_arrangement"]
+        add_on_service = validated_data["add_on_service"]
+        extra_minutes = validated_data.get("extra_minutes", 0)
+        total_duration = validated_data["total_duration"]
 
         # Find or create recipient user by phone number
         recipient_phone = validated_data["recipient_phone"]
         recipient_name = validated_data.get("recipient_name", "")
-        recipient_user = User.objects.filter(phone_number=recipient_phone).first()
-
-        if not recipient_user:
-            from django.utils.crypto import get_random_string
-
-            password = get_random_string(6)
-            recipient_user = User.objects.create_user(
-                phone_number=recipient_phone,
-                password=password,
-                first_name=recipient_name or "Recipient",
-                last_name="GiftUser",
-                user_type=UserType.CUSTOMER,
-                is_phone_verified=True,
-            )
-
-            # Send SMS with temporary credentials
-            try:
-                from config.utils.sms_service import send_sms_async
-
-                message = (
-                    f"Welcome to USH Spa! An account has been created for you. "
-                    f"Your temporary password is: {password}. "
-                    f"You can now login and manage your gift cards."
-                )
-                send_sms_async(str(recipient_phone), message)
-            except Exception:
-                pass  # Don't fail gift card creation if SMS fails
+        recipient_user, _ = get_or_create_recipient_user(recipient_phone, recipient_name)
 
         gift_card = GiftCard.objects.create(
             sender=self.context["request"].user,
@@ -657,6 +618,45 @@ class GiftCardDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    SELECT_RELATED = (
+        "sender",
+        "recipient",
+        "service",
+        "spa_center",
+        "spa_center__city",
+        "spa_center__country",
+        "service_arrangement",
+        "add_on_service",
+    )
+    PREFETCH_RELATED = (
+        "service__images",
+        # Only the booking date/time is rendered, so fetch bookings joined to
+        # their time slot with just those columns (one query instead of two).
+        Prefetch(
+            "gift_card_bookings",
+            queryset=Booking.objects.select_related("time_slot").only(
+                "id", "gift_card", "time_slot", "time_slot__date", "time_slot__start_time",
+            ),
+            to_attr="prefetched_bookings",
+        ),
+    )
+
+    def __init__(self, instance=None, *args, **kwargs):
+        super().__init__(instance, *args, **kwargs)
+        # Single instances may come from views that did not eager-load;
+        # already cached relations are skipped, so this is cheap otherwise.
+        if isinstance(instance, GiftCard):
+            prefetch_related_objects(
+                [instance], *self.SELECT_RELATED, *self.PREFETCH_RELATED,
+            )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Apply the joins and prefetches needed to serialize *queryset*."""
+        return queryset.select_related(*cls.SELECT_RELATED).prefetch_related(
+            *cls.PREFETCH_RELATED,
+        )
+
     def get_sender_name(self, obj):
         return obj.sender.get_full_name() or str(obj.sender)
 
@@ -667,30 +667,28 @@ class GiftCardDetailSerializer(serializers.ModelSerializer):
 
     def get_service_image(self, obj):
         """Return the URL of the primary service image (or first available)."""
-        image = (
-            obj.service.images.filter(is_primary=True).first()
-            or obj.service.images.first()
-        )
-        if image and image.image:
-            request = self.context.get("request")
-            if request:
-                return request.build_absolute_uri(image.image.url)
-            return image.image.url
-        return None
+        return _primary_image_url(obj.service.images, self.context.get("request"))
 
     def get_public_url(self, obj):
         return obj.get_public_url()
 
+    def _get_booking(self, obj):
+        """Return the booking associated with this gift card, if any."""
+        bookings = getattr(obj, "prefetched_bookings", None)
+        if bookings is None:
+            bookings = obj.gift_card_bookings.all()
+        return next(iter(bookings), None)
+
     def get_booking_date(self, obj):
         """Return the date of the booking associated with this gift card."""
-        booking = obj.gift_card_bookings.first()
+        booking = self._get_booking(obj)
         if booking:
             return booking.booking_date
         return None
 
     def get_booking_time(self, obj):
         """Return the start time of the booking associated with this gift card."""
-        booking = obj.gift_card_bookings.first()
+        booking = self._get_booking(obj)
         if booking:
             return booking.booking_time
         return None
@@ -736,7 +734,7 @@ class GiftCardPublicSerializer(serializers.ModelSerializer):
         source="spa_center.longitude", max_digits=9, decimal_places=6, read_only=True,
     )
     sender_name = serializers.SerializerMethodField()
-    is_valid = serializers.SerializerMethodField()
+    is_valid = serializers.BooleanField(source="is_redeemable", read_only=True)
     is_redeemable = serializers.BooleanField(read_only=True)
     is_locked = serializers.BooleanField(read_only=True)
     spa_center_image = serializers.SerializerMethodField()
@@ -796,20 +794,7 @@ class GiftCardPublicSerializer(serializers.ModelSerializer):
 
     def get_service_image(self, obj):
         """Return the URL of the primary service image (or first available)."""
-        image = (
-            obj.service.images.filter(is_primary=True).first()
-            or obj.service.images.first()
-        )
-        if image and image.image:
-            request = self.context.get("request")
-            if request:
-                return request.build_absolute_uri(image.image.url)
-            return image.image.url
-        return None
-
-    def get_is_valid(self, obj):
-        """Check if the gift card is currently valid and redeemable."""
-        return obj.is_redeemable
+        return _primary_image_url(obj.service.images, self.context.get("request"))
 
     def get_redeemed_booking_date(self, obj):
         """Return the booking date from the redeemed booking's time slot."""
@@ -832,31 +817,41 @@ class GiftCardPublicSerializer(serializers.ModelSerializer):
     def get_spa_center_image(self, obj):
         """Return the URL of the spa center's primary image."""
         if hasattr(obj.spa_center, 'images'):
-            image = (
-                obj.spa_center.images.filter(is_primary=True).first()
-                or obj.spa_center.images.first()
-            )
-            if image and image.image:
-                request = self.context.get("request")
-                if request:
-                    return request.build_absolute_uri(image.image.url)
-                return image.image.url
+            return _primary_image_url(obj.spa_center.images, self.context.get("request"))
         return None
 
 
 class GiftCardValidityCheckSerializer(serializers.Serializer):
     """Serializer for checking gift card validity (public, no auth required)."""
 
+    # Gift card columns read by GiftCardValidityCheckView; the lookup is
+    # read-only, so the message and code columns are never loaded. The joined
+    # service and spa center rows are kept whole because their translated
+    # ``name`` is resolved per language.
+    ONLY_FIELDS = (
+        "id",
+        "status",
+        "expires_at",
+        "failed_attempts",
+        "max_attempts",
+        "service",
+        "spa_center",
+    )
+
     public_token = serializers.CharField()
 
-    def validate_public_token(self, value):
-        try:
-            gift_card = GiftCard.objects.select_related(
-                "service", "spa_center", "spa_center__city", "spa_center__country", "sender",
-            ).get(public_token=value)
-        except GiftCard.DoesNotExist:
-            raise serializers.ValidationError("Gift card not found.")
-        return value
+    def validate(self, attrs):
+        """Resolve the gift card once and hand it to the view via ``attrs``."""
+        gift_card = get_gift_card_by_token(
+            attrs["public_token"],
+            GiftCard.objects.select_related(
+                "service", "spa_center",
+            ).only(*self.ONLY_FIELDS),
+        )
+        if gift_card is None:
+            raise serializers.ValidationError({"public_token": "Gift card not found."})
+        attrs["gift_card"] = gift_card
+        return attrs
 
 
 class GiftCardRedeemSerializer(serializers.Serializer):
@@ -873,16 +868,20 @@ class GiftCardRedeemSerializer(serializers.Serializer):
         help_text="6-digit secret code received via SMS",
     )
 
-    def validate_public_token(self, value):
-        try:
-            gift_card = GiftCard.objects.select_related(
-                "service", "spa_center", "sender",
-            ).get(public_token=value)
-        except GiftCard.DoesNotExist:
-            raise serializers.ValidationError("Gift card not found.")
-        return value
-
     def validate_secret_code(self, value):
         if not value.isdigit() or len(value) != 6:
             raise serializers.ValidationError("Secret code must be exactly 6 digits.")
         return value
+
+    def validate(self, attrs):
+        """Resolve the gift card once and hand it to the view via ``attrs``."""
+        gift_card = get_gift_card_by_token(
+            attrs["public_token"],
+            GiftCard.objects.select_related(
+                "service", "spa_center", "sender", "service_arrangement", "recipient",
+            ),
+        )
+        if gift_card is None:
+            raise serializers.ValidationError({"public_token": "Gift card not found."})
+        attrs["gift_card"] = gift_card
+        return attrs
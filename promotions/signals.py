@@ -9,9 +9,11 @@ Note: Loyalty is NOT awarded for gift card purchases (only for direct paid booki
 
 import logging
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
+from config.cache_utils import LOYALTY_STATUS_CACHE_PREFIX, invalidate_user_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,7 +72,7 @@ def send_sms_on_gift_card_activation(sender, instance, created, **kwargs):
 
     try:
         from promotions.tasks import send_gift_card_sms
-        send_gift_card_sms(str(instance.id))
+        send_gift_card_sms(str(instance.id), gift_card=instance)
         logger.info(
             "Gift card SMS sent for gift card %s (admin activation).",
             instance.pk,
@@ -173,3 +175,10 @@ def award_loyalty_on_payment_success(sender, instance, **kwargs):
             tracker.booking_count,
             tracker.bookings_required,
         )
+
+
+@receiver([post_save, post_delete], sender="promotions.LoyaltyTracker")
+@receiver([post_save, post_delete], sender="promotions.LoyaltyReward")
+def invalidate_loyalty_status_cache(sender, instance, **kwargs):
+    """Drop the customer's cached loyalty dashboard when progress or rewards change."""
+    invalidate_user_cache(LOYALTY_STATUS_CACHE_PREFIX, instance.customer_id)
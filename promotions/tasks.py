@@ -4,32 +4,61 @@ Task Functions for Promotions App.
 
 import logging
 from django.utils import timezone
+from simple_history.utils import bulk_update_with_history
+from accounts.managers import normalize_phone_number
 from promotions.models import GiftCard
-from config.utils.sms_service import send_sms_async
+from config.utils.sms_service import send_sms_async, send_sms_batch_async
 
 logger = logging.getLogger(__name__)
 
+# Message templates are built once at import and filled with format_map()
+# on each send, instead of re-assembling multi-part f-strings per call.
+_GIFT_CARD_SMS_TMPL = (
+    "Hi{recipient_hint}, {sender_name} sent you a {service_name} gift! "
+    "Your secret code is: {secret_code}. "
+    "View details and redeem: {public_url}"
+)
 
-def send_gift_card_sms(gift_card_id):
+_RECIPIENT_WELCOME_SMS_TMPL = (
+    "Welcome to USH Spa! An account has been created for you. "
+    "Your temporary password is: {password}. "
+    "You can now login and manage your gift cards."
+)
+
+
+def _build_gift_card_sms(gift_card):
+    """
+    Return the ``(phone_number, message)`` pair for a gift card notification.
+
+    Expects ``sender`` and ``service`` to be loaded on the gift card.
+    """
+    sender_name = gift_card.sender.get_full_name() or gift_card.sender.email
+    recipient_hint = f" {gift_card.recipient_name}" if gift_card.recipient_name else ""
+
+    message = _GIFT_CARD_SMS_TMPL.format_map({
+        "recipient_hint": recipient_hint,
+        "sender_name": sender_name,
+        "service_name": gift_card.service.name,
+        "secret_code": gift_card.secret_code,
+        "public_url": gift_card.get_public_url(),
+    })
+    return normalize_phone_number(gift_card.recipient_phone), message
+
+
+def send_gift_card_sms(gift_card_id, gift_card=None):
     """
     Fetch the gift card and send a notification SMS to the recipient.
     This replaces the SQS consumer logic.
+
+    Callers that already hold the gift card (with sender and service loaded)
+    can pass it as ``gift_card`` to skip the re-fetch.
     """
     try:
-        gift_card = GiftCard.objects.get(id=gift_card_id)
-        phone_number = str(gift_card.recipient_phone)
-        secret_code = gift_card.secret_code
-        public_url = gift_card.get_public_url()
-        sender_name = gift_card.sender.get_full_name() or gift_card.sender.email
-        service_name = gift_card.service.name
-
-        recipient_hint = f" {gift_card.recipient_name}" if gift_card.recipient_name else ""
-        
-        message = (
-            f"Hi{recipient_hint}, {sender_name} sent you a {service_name} gift! "
-            f"Your secret code is: {secret_code}. "
-            f"View details and redeem: {public_url}"
-        )
+        if gift_card is None:
+            gift_card = GiftCard.objects.select_related(
+                "sender", "service",
+            ).get(id=gift_card_id)
+        phone_number, message = _build_gift_card_sms(gift_card)
 
         logger.info(f"Sending gift card SMS for {gift_card_id} to {phone_number}")
         
@@ -49,3 +78,51 @@ def send_gift_card_sms(gift_card_id):
     except Exception as e:
         logger.error(f"Error sending gift card SMS for {gift_card_id}: {e}")
         return {"success": False, "error": str(e)}
+
+
+def send_gift_card_sms_batch(gift_cards):
+    """
+    Send notification SMS for several gift cards at once.
+
+    Messages are dispatched from a single background thread and the
+    ``sms_sent`` flags are written with one bulk update (with history),
+    instead of one thread and one save per gift card. ``gift_cards`` should have ``sender`` and
+    ``service`` loaded.
+
+    Returns:
+        int: Number of gift cards an SMS was queued for.
+    """
+    messages = []
+    sent = []
+    for gift_card in gift_cards:
+        try:
+            messages.append(_build_gift_card_sms(gift_card))
+            sent.append(gift_card)
+        except Exception as e:
+            logger.error(f"Error building gift card SMS for {gift_card.id}: {e}")
+
+    if not messages:
+        return 0
+
+    logger.info(f"Sending gift card SMS for {len(messages)} gift cards")
+    send_sms_batch_async(messages)
+
+    # Update gift card status (optimistic tracking)
+    now = timezone.now()
+    for gift_card in sent:
+        gift_card.sms_sent = True
+        gift_card.sms_sent_at = now
+        gift_card.updated_at = now
+    bulk_update_with_history(
+        sent, GiftCard, ["sms_sent", "sms_sent_at", "updated_at"],
+    )
+    return len(sent)
+
+
+def send_recipient_welcome_sms(phone_number, password):
+    """
+    Send the temporary credentials to a gift card recipient whose
+    account was created on their behalf.
+    """
+    message = _RECIPIENT_WELCOME_SMS_TMPL.format_map({"password": password})
+    send_sms_async(normalize_phone_number(phone_number), message)
@@ -0,0 +1,282 @@
+"""
+Gift Card Tests.
+
+Covers the received gift card inbox pagination, gift card redemption and
+batch SMS sending.
+
+Run with:
+    python -m pytest promotions/tests/test_gift_cards.py -v --ds=config.settings
+"""
+
+from datetime import time, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from promotions.models import GiftCard
+from promotions.tasks import send_gift_card_sms_batch
+from spacenter.models import (
+    City,
+    Country,
+    Room,
+    Service,
+    ServiceArrangement,
+    Specialty,
+    SpaCenter,
+)
+
+User = get_user_model()
+
+
+class GiftCardFixtureMixin:
+    """Creates a spa, service, arrangement and the users exchanging gift cards."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.country = Country.objects.create(
+            name="Qatar", code="QAT", phone_code="+974"
+        )
+        cls.city = City.objects.create(country=cls.country, name="Doha")
+        cls.specialty = Specialty.objects.create(name="Massage")
+
+        cls.spa = SpaCenter.objects.create(
+            name="Test Spa",
+            slug="test-spa",
+            country=cls.country,
+            city=cls.city,
+            address="Corniche",
+            default_opening_time=time(9, 0),
+            default_closing_time=time(21, 0),
+        )
+        cls.service = Service.objects.create(
+            name="Swedish Massage",
+            specialty=cls.specialty,
+            country=cls.country,
+            city=cls.city,
+            duration_minutes=60,
+            base_price=Decimal("100.00"),
+            spa_center=cls.spa,
+        )
+        cls.room = Room.objects.create(spa_center=cls.spa, room_id="R1")
+        cls.arrangement = ServiceArrangement.objects.create(
+            spa_center=cls.spa,
+            room=cls.room,
+            arrangement_type=ServiceArrangement.ArrangementType.SINGLE_ROOM,
+            arrangement_label="Single R1",
+        )
+
+        cls.sender = User.objects.create_user(
+            email="sender@test.com",
+            password="pass123",
+            phone_number="+97455001111",
+            is_email_verified=True,
+        )
+        cls.recipient = User.objects.create_user(
+            email="recipient@test.com",
+            password="pass123",
+            phone_number="+97455002222",
+            is_email_verified=True,
+        )
+
+    @classmethod
+    def make_gift_card(cls, **kwargs):
+        defaults = {
+            "sender": cls.sender,
+            "recipient": cls.recipient,
+            "recipient_phone": "+97455002222",
+            "service": cls.service,
+            "spa_center": cls.spa,
+            "service_arrangement": cls.arrangement,
+            "amount": Decimal("100.00"),
+            "status": GiftCard.GiftCardStatus.ACTIVE,
+        }
+        defaults.update(kwargs)
+        return GiftCard.objects.create(**defaults)
+
+
+# =============================================================================
+# Received gift cards (page-number and cursor pagination)
+# =============================================================================
+
+
+class UserGiftCardPaginationTests(GiftCardFixtureMixin, APITestCase):
+    """Paging through the received gift card inbox."""
+
+    url = "/api/v1/promotions/my-gift-cards/"
+    cursor_url = "/api/v1/promotions/my-gift-cards/cursor/"
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        now = timezone.now()
+        cls.cards = [
+            cls.make_gift_card(
+                # Every other card has no expiry
+                expires_at=None if i % 2 else now + timedelta(days=30),
+            )
+            for i in range(7)
+        ]
+
+    def setUp(self):
+        self.client.force_authenticate(self.recipient)
+
+    def _collect(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(card["id"] for card in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_list_keeps_page_number_pagination(self):
+        response = self.client.get(f"{self.url}?page=1&ordering=expires_at")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], len(self.cards))
+        self.assertEqual(len(response.data["results"]), len(self.cards))
+
+    def test_list_rejects_unsupported_ordering(self):
+        response = self.client.get(f"{self.url}?ordering=secret_code")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("ordering", response.data)
+
+    def test_cursor_pages_cover_every_card_once_with_null_expiry(self):
+        ids = self._collect(f"{self.cursor_url}?page_size=2")
+
+        self.assertEqual(len(ids), len(self.cards))
+        self.assertEqual(set(ids), {str(card.id) for card in self.cards})
+
+    def test_cursor_is_newest_first(self):
+        ids = self._collect(f"{self.cursor_url}?page_size=3")
+
+        expected = [
+            str(pk)
+            for pk in GiftCard.objects.filter(recipient=self.recipient)
+            .order_by("-created_at")
+            .values_list("id", flat=True)
+        ]
+        self.assertEqual(ids, expected)
+
+    def test_cursor_rejects_ordering(self):
+        response = self.client.get(f"{self.cursor_url}?ordering=expires_at")
+
+        self.assertEqual(response.status_code, 400)
+
+
+# =============================================================================
+# Failed redemption attempts
+# =============================================================================
+
+
+class GiftCardFailedAttemptTests(GiftCardFixtureMixin, APITestCase):
+    """Wrong secret codes are counted up to max_attempts."""
+
+    def test_counter_stops_at_max_attempts(self):
+        card = self.make_gift_card(max_attempts=3, failed_attempts=2)
+        stale = GiftCard.objects.get(pk=card.pk)
+
+        self.assertTrue(card.record_failed_attempt())
+        # A concurrent request still holding the old counter
+        self.assertFalse(stale.record_failed_attempt())
+
+        card.refresh_from_db()
+        self.assertEqual(card.failed_attempts, 3)
+        self.assertEqual(stale.failed_attempts, 3)
+
+    def test_failed_attempt_records_history(self):
+        card = self.make_gift_card()
+        history_before = card.history.count()
+
+        card.record_failed_attempt()
+
+        self.assertEqual(card.history.count(), history_before + 1)
+        self.assertEqual(card.history.first().failed_attempts, 1)
+
+
+# =============================================================================
+# Redemption of legacy gift cards (no recipient FK)
+# =============================================================================
+
+
+class LegacyGiftCardRedeemTests(GiftCardFixtureMixin, APITestCase):
+    """A card without a recipient gets linked on the first redeem attempt."""
+
+    url = "/gift-cards/api/redeem/"
+    phone = "+97455003333"
+
+    def make_legacy_card(self, **kwargs):
+        return self.make_gift_card(
+            recipient=None,
+            recipient_phone=self.phone,
+            secret_code="123456",
+            **kwargs,
+        )
+
+    def redeem(self, card, code):
+        return self.client.post(
+            self.url,
+            {"public_token": card.public_token, "secret_code": code},
+            format="json",
+        )
+
+    def test_wrong_code_still_links_recipient(self):
+        card = self.make_legacy_card()
+
+        response = self.redeem(card, "654321")
+
+        self.assertEqual(response.status_code, 400)
+        card.refresh_from_db()
+        self.assertEqual(card.failed_attempts, 1)
+        self.assertIsNotNone(card.recipient)
+        self.assertEqual(card.recipient.phone_number, self.phone)
+
+    def test_expired_card_still_links_recipient(self):
+        card = self.make_legacy_card(expires_at=timezone.now() - timedelta(days=1))
+
+        response = self.redeem(card, "123456")
+
+        self.assertEqual(response.status_code, 400)
+        card.refresh_from_db()
+        self.assertEqual(card.status, GiftCard.GiftCardStatus.ACTIVE)
+        self.assertEqual(card.recipient.phone_number, self.phone)
+
+    def test_retry_reuses_linked_recipient(self):
+        card = self.make_legacy_card()
+
+        self.redeem(card, "654321")
+        response = self.redeem(card, "123456")
+
+        self.assertEqual(response.status_code, 200)
+        card.refresh_from_db()
+        self.assertEqual(card.status, GiftCard.GiftCardStatus.REDEEMED)
+        self.assertEqual(card.redeemed_by, card.recipient)
+        self.assertEqual(User.objects.filter(phone_number=self.phone).count(), 1)
+
+
+# =============================================================================
+# Batch SMS sending
+# =============================================================================
+
+
+class GiftCardSmsBatchTests(GiftCardFixtureMixin, APITestCase):
+    """Resending SMS for several gift cards at once."""
+
+    @mock.patch("promotions.tasks.send_sms_batch_async")
+    def test_marks_cards_sent_and_records_history(self, send_batch):
+        cards = [self.make_gift_card() for _ in range(3)]
+        history_before = GiftCard.history.count()
+
+        count = send_gift_card_sms_batch(
+            GiftCard.objects.filter(pk__in=[c.pk for c in cards])
+            .select_related("sender", "service")
+        )
+
+        self.assertEqual(count, 3)
+        send_batch.assert_called_once()
+        self.assertEqual(GiftCard.objects.filter(sms_sent=True, sms_sent_at__isnull=False).count(), 3)
+        self.assertEqual(GiftCard.history.count(), history_before + 3)
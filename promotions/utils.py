@@ -0,0 +1,90 @@
+"""
+Promotions Utility Functions.
+
+Shared helpers used by the gift card views and serializers.
+"""
+
+import hashlib
+import logging
+
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import transaction
+
+from accounts.managers import normalize_phone_number
+from accounts.models import User, UserType
+from config.cache_utils import (
+    GIFT_CARD_MISS_CACHE_PREFIX,
+    GIFT_CARD_MISS_CACHE_TIMEOUT,
+)
+
+from .models import GiftCard, generate_temporary_password
+from .tasks import send_recipient_welcome_sms
+
+logger = logging.getLogger(__name__)
+
+
+def get_or_create_recipient_user(phone_number, recipient_name=""):
+    """
+    Return the customer account for a gift card recipient, creating it if needed.
+
+    Uses a single ``get_or_create`` keyed on the normalized phone number so
+    concurrent gift card flows cannot create duplicate accounts. The password
+    default is a callable, so the hash is only computed when a user is
+    actually inserted. New recipients receive their temporary password by SMS
+    once the surrounding transaction commits.
+
+    Returns:
+        tuple: ``(user, created)``
+    """
+    password = generate_temporary_password()
+
+    with transaction.atomic():
+        user, created = User.objects.get_or_create(
+            phone_number=normalize_phone_number(phone_number),
+            defaults={
+                "password": lambda: make_password(password),
+                "first_name": recipient_name or "Recipient",
+                "last_name": "GiftUser",
+                "user_type": UserType.CUSTOMER,
+                "is_phone_verified": True,
+            },
+        )
+
+        if created:
+            transaction.on_commit(
+                lambda: _send_welcome_sms(phone_number, password)
+            )
+
+    return user, created
+
+
+def _send_welcome_sms(phone_number, password):
+    """Send recipient credentials without failing the gift card flow."""
+    try:
+        send_recipient_welcome_sms(phone_number, password)
+    except Exception as e:
+        logger.error(f"Failed to send welcome SMS to {phone_number}: {e}")
+
+
+def get_gift_card_by_token(public_token, queryset=None):
+    """
+    Return the gift card for a public token, or ``None`` if there is none.
+
+    Used by the unauthenticated gift card endpoints. Unknown tokens are
+    cached briefly so repeated probes for the same token do not reach the
+    database. Found gift cards are never cached, because their status and
+    attempt counters must be current.
+    """
+    if queryset is None:
+        queryset = GiftCard.objects.all()
+
+    token_hash = hashlib.md5(str(public_token).encode()).hexdigest()
+    miss_key = f"{GIFT_CARD_MISS_CACHE_PREFIX}:{token_hash}"
+    if cache.get(miss_key):
+        return None
+
+    gift_card = queryset.filter(public_token=public_token).first()
+    if gift_card is None:
+        cache.set(miss_key, True, GIFT_CARD_MISS_CACHE_TIMEOUT)
+    return gift_card
@@ -4,20 +4,34 @@ Promotions (Gift Cards & Loyalty Program) Views.
 
 from collections import defaultdict
 from datetime import datetime, timedelta
+from decimal import Decimal
 
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Now
 from django.shortcuts import get_object_or_404, render
 from django.utils import timezone
 from django_filters import rest_framework as django_filters
 from rest_framework import filters, permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
+from rest_framework.throttling import AnonRateThrottle, ScopedRateThrottle
 from rest_framework.views import APIView
 
+from bookings.models import Booking, TimeSlot
+from config.cache_utils import (
+    LOYALTY_STATUS_CACHE_PREFIX,
+    USER_CACHE_TIMEOUT,
+    build_user_cache_key,
+)
+
 from .models import (
     GiftCard,
     LoyaltyReward,
-    LoyaltyTracker
+    LoyaltyTracker,
 )
 from .serializers import (
     GiftCardCreateSerializer,
@@ -29,6 +43,97 @@ from .serializers import (
     LoyaltyRewardSerializer,
     LoyaltyTrackerSerializer
 )
+from .tasks import send_gift_card_sms
+from .utils import get_gift_card_by_token, get_or_create_recipient_user
+
+# =============================================================================
+# Pagination
+# =============================================================================
+
+class GiftCardCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the opt-in ``/my-gift-cards/cursor/`` list.
+
+    Pages are indexed range scans on (recipient, created_at), so deep pages
+    cost the same as the first one. The order is fixed and responses carry
+    ``next``/``previous`` cursors but no ``count``.
+    """
+
+    ordering = "-created_at"
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+# =============================================================================
+# Filters
+# =============================================================================
+
+class StrictOrderingFilter(filters.OrderingFilter):
+    """OrderingFilter that rejects unsupported fields with a 400."""
+
+    def get_ordering(self, request, queryset, view):
+        params = request.query_params.get(self.ordering_param)
+        if params:
+            fields = [param.strip() for param in params.split(",") if param.strip()]
+            valid = self.remove_invalid_fields(queryset, fields, view, request)
+            invalid = [field for field in fields if field not in valid]
+            if invalid:
+                raise ValidationError({
+                    self.ordering_param: f"Unsupported ordering: {', '.join(invalid)}."
+                })
+        return super().get_ordering(request, queryset, view)
+
+
+class LoyaltyRewardFilter(django_filters.FilterSet):
+    """Filter for loyalty rewards."""
+
+    is_available = django_filters.BooleanFilter(
+        method="filter_is_available",
+        help_text="Filter rewards that can still be redeemed",
+    )
+
+    class Meta:
+        model = LoyaltyReward
+        fields = ["status", "service", "is_available"]
+
+    def filter_is_available(self, queryset, name, value):
+        """Mirror LoyaltyReward.is_available in SQL."""
+        available = Q(status=LoyaltyReward.RewardStatus.AVAILABLE) & (
+            Q(expires_at__isnull=True) | Q(expires_at__gte=Now())
+        )
+        if value is True:
+            return queryset.filter(available)
+        elif value is False:
+            return queryset.exclude(available)
+        return queryset
+
+
+class GiftCardFilter(django_filters.FilterSet):
+    """Filter for gift cards."""
+
+    is_redeemable = django_filters.BooleanFilter(
+        method="filter_is_redeemable",
+        help_text="Filter gift cards that can currently be redeemed",
+    )
+
+    class Meta:
+        model = GiftCard
+        fields = ["status", "service", "spa_center", "currency", "is_redeemable"]
+
+    def filter_is_redeemable(self, queryset, name, value):
+        """Mirror GiftCard.is_redeemable in SQL."""
+        redeemable = (
+            Q(status=GiftCard.GiftCardStatus.ACTIVE)
+            & (Q(expires_at__isnull=True) | Q(expires_at__gte=Now()))
+            & Q(remaining_attempts__gt=0)
+        )
+        if value is True:
+            return queryset.filter(redeemable)
+        elif value is False:
+            return queryset.exclude(redeemable)
+        return queryset
+
 
 # =============================================================================
 # Loyalty Program Views
@@ -54,7 +159,9 @@ class LoyaltyTrackerViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         return LoyaltyTracker.objects.filter(
             customer=self.request.user,
-        ).select_related("service", "service_arrangement")
+        ).select_related(
+            "service", "service_arrangement",
+        ).prefetch_related("service__images")
 
 
 class LoyaltyRewardViewSet(viewsets.ReadOnlyModelViewSet):
@@ -70,14 +177,16 @@ class LoyaltyRewardViewSet(viewsets.ReadOnlyModelViewSet):
         django_filters.DjangoFilterBackend,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["status", "service"]
+    filterset_class = LoyaltyRewardFilter
     ordering_fields = ["created_at", "status"]
     ordering = ["-created_at"]
 
     def get_queryset(self):
         return LoyaltyReward.objects.filter(
             customer=self.request.user,
-        ).select_related("service", "service_arrangement")
+        ).select_related(
+            "service", "service_arrangement",
+        ).prefetch_related("service__images")
 
     @action(detail=False, methods=["post"])
     def redeem(self, request):
@@ -100,7 +209,6 @@ class LoyaltyRewardViewSet(viewsets.ReadOnlyModelViewSet):
         booking = serializer.save()
 
         # Reload the reward for fresh status
-        from .models import LoyaltyReward
         reward = booking.loyalty_reward
         reward.refresh_from_db()
 
@@ -133,9 +241,37 @@ class LoyaltyStatusView(APIView):
         """
         user = request.user
 
+        cache_key = build_user_cache_key(LOYALTY_STATUS_CACHE_PREFIX, user.pk)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+        totals = LoyaltyReward.objects.filter(customer=user).aggregate(
+            total_earned=Count("id"),
+            total_redeemed=Count(
+                "id", filter=Q(status=LoyaltyReward.RewardStatus.REDEEMED),
+            ),
+        )
+        has_trackers = LoyaltyTracker.objects.filter(customer=user).exists()
+
+        # Users who have not booked an eligible service yet have nothing to
+        # list; skip the tracker and reward fetches entirely.
+        if not has_trackers and not totals["total_earned"]:
+            data = {
+                "trackers": [],
+                "most_recent_rewards": [],
+                "available_rewards": [],
+                "total_rewards_earned": 0,
+                "total_rewards_redeemed": 0,
+            }
+            cache.set(cache_key, data, USER_CACHE_TIMEOUT)
+            return Response(data)
+
         all_trackers = LoyaltyTracker.objects.filter(
             customer=user,
-        ).select_related("service", "service_arrangement")
+        ).select_related(
+            "service", "service_arrangement",
+        ).prefetch_related("service__images")
 
         # Split trackers: active progress vs. recently rewarded (counter reset to 0)
         trackers = all_trackers.filter(booking_count__gt=0)
@@ -144,23 +280,21 @@ class LoyaltyStatusView(APIView):
         available_rewards = LoyaltyReward.objects.filter(
             customer=user,
             status=LoyaltyReward.RewardStatus.AVAILABLE,
-        ).select_related("service", "service_arrangement")
-
-        all_rewards = LoyaltyReward.objects.filter(customer=user)
-        total_earned = all_rewards.count()
-        total_redeemed = all_rewards.filter(
-            status=LoyaltyReward.RewardStatus.REDEEMED,
-        ).count()
+        ).select_related(
+            "service", "service_arrangement",
+        ).prefetch_related("service__images")
 
         context = {"request": request}
 
-        return Response({
+        data = {
             "trackers": LoyaltyTrackerSerializer(trackers, many=True, context=context).data,
             "most_recent_rewards": LoyaltyTrackerSerializer(most_recent_rewards, many=True, context=context).data,
             "available_rewards": LoyaltyRewardSerializer(available_rewards, many=True, context=context).data,
-            "total_rewards_earned": total_earned,
-            "total_rewards_redeemed": total_redeemed,
-        })
+            "total_rewards_earned": totals["total_earned"],
+            "total_rewards_redeemed": totals["total_redeemed"],
+        }
+        cache.set(cache_key, data, USER_CACHE_TIMEOUT)
+        return Response(data)
 
 
 # =============================================================================
@@ -181,8 +315,8 @@ class GiftCardViewSet(viewsets.ModelViewSet):
         django_filters.DjangoFilterBackend,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["status"]
-    ordering_fields = ["created_at", "status"]
+    filterset_class = GiftCardFilter
+    ordering_fields = ["created_at", "status", "expires_at", "amount"]
     ordering = ["-created_at"]
 
     def get_serializer_class(self):
@@ -191,11 +325,8 @@ class GiftCardViewSet(viewsets.ModelViewSet):
         return GiftCardDetailSerializer
 
     def get_queryset(self):
-        return GiftCard.objects.filter(
-            sender=self.request.user,
-        ).select_related(
-            "service", "spa_center", "spa_center__city", "spa_center__country",
-            "service_arrangement",
+        return GiftCardDetailSerializer.setup_eager_loading(
+            GiftCard.objects.filter(sender=self.request.user),
         )
 
     def create(self, request, *args, **kwargs):
@@ -250,9 +381,8 @@ class GiftCardViewSet(viewsets.ModelViewSet):
             gift_card.activate()
 
             # Enqueue gift card SMS to recipient
-            from .tasks import send_gift_card_sms
             try:
-                send_gift_card_sms(str(gift_card.id))
+                send_gift_card_sms(str(gift_card.id), gift_card=gift_card)
             except Exception:
                 pass
 
@@ -295,9 +425,7 @@ class GiftCardViewSet(viewsets.ModelViewSet):
         gift_card.activate()
 
         # Enqueue gift card SMS to SQS (ush_gift_sms_queue)
-        from .tasks import send_gift_card_sms
-
-        send_gift_card_sms(str(gift_card.id))
+        send_gift_card_sms(str(gift_card.id), gift_card=gift_card)
 
         detail_serializer = GiftCardDetailSerializer(
             gift_card, context={"request": request},
@@ -376,6 +504,7 @@ class GiftCardPublicView(APIView):
                 "service_arrangement",
                 "redeemed_booking",
                 "redeemed_booking__time_slot",
+                "fulfilled_by",
             ),
             public_token=public_token,
         )
@@ -430,6 +559,8 @@ class GiftCardVerifyCodeView(APIView):
 
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
+    throttle_classes = [AnonRateThrottle, ScopedRateThrottle]
+    throttle_scope = "gift_card_lookup"
 
     def post(self, request):
         public_token = request.data.get("public_token")
@@ -441,9 +572,8 @@ class GiftCardVerifyCodeView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            gift_card = GiftCard.objects.get(public_token=public_token)
-        except GiftCard.DoesNotExist:
+        gift_card = get_gift_card_by_token(public_token)
+        if gift_card is None:
             return Response(
                 {"valid": False, "message": "Gift card not found."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -482,9 +612,6 @@ class GiftCardAvailabilityView(APIView):
     authentication_classes = []
 
     def get(self, request, public_token):
-        from bookings.models import TimeSlot
-        from spacenter.models import ServiceArrangement
-
         gift_card = get_object_or_404(
             GiftCard.objects.select_related(
                 "service",
@@ -504,12 +631,13 @@ class GiftCardAvailabilityView(APIView):
         date_from = today
         date_to = today + timedelta(days=30)
 
-        # Get booked time slots for this arrangement
+        # Get booked time slots for this arrangement; only the times are read,
+        # so stream them instead of caching full model rows.
         booked_slots = TimeSlot.objects.filter(
             arrangement=arrangement,
             date__gte=date_from,
             date__lte=date_to,
-        )
+        ).only("date", "start_time", "end_time").iterator(chunk_size=500)
 
         # Build booked map
         booked_map = defaultdict(set)
@@ -530,10 +658,11 @@ class GiftCardAvailabilityView(APIView):
         current_date = date_from
         while current_date <= date_to:
             date_str = current_date.isoformat()
+            day_booked = booked_map.get(date_str, ())
             day_slots = {}
             for hour in all_hours:
                 hour_range = f"{hour} - {int(hour[:2])+1:02d}:00"
-                if hour_range in booked_map.get(date_str, set()):
+                if hour_range in day_booked:
                     day_slots[hour] = "booked"
                 else:
                     day_slots[hour] = "available"
@@ -559,46 +688,20 @@ class GiftCardRedeemBookingView(APIView):
 
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
+    throttle_classes = [AnonRateThrottle, ScopedRateThrottle]
+    throttle_scope = "gift_card_lookup"
 
     def _get_or_create_recipient_user(self, gift_card):
         """
         Get or create a user for the gift card recipient.
         If created, set a random password and send an SMS.
         """
-        from accounts.models import User, UserType
-        from config.utils.sms_service import send_sms_async
-        
-        phone_number = gift_card.recipient_phone
-        user = User.objects.filter(phone_number=phone_number).first()
-        
-        if not user:
-            # Create user
-            from django.utils.crypto import get_random_string
-            password = get_random_string(6)
-            user = User.objects.create_user(
-                phone_number=phone_number,
-                password=password,
-                first_name=gift_card.recipient_name or "Recipient",
-                last_name="GiftUser",
-                user_type=UserType.CUSTOMER,
-                is_phone_verified=True
-            )
-            
-            # Send SMS with password
-            message = (
-                f"Welcome to USH Spa! An account has been created for you. "
-                f"Your temporary password is: {password}. "
-                f"You can now login and manage your gift cards."
-            )
-            send_sms_async(str(phone_number), message)
-            
+        user, _ = get_or_create_recipient_user(
+            gift_card.recipient_phone, gift_card.recipient_name,
+        )
         return user
 
     def post(self, request):
-        from bookings.models import Booking, TimeSlot
-        from django.db import transaction
-        from decimal import Decimal
-
         public_token = request.data.get("public_token")
         secret_code = request.data.get("secret_code")
         date_str = request.data.get("date")
@@ -612,11 +715,14 @@ class GiftCardRedeemBookingView(APIView):
             )
 
         # Get the gift card
-        try:
-            gift_card = GiftCard.objects.select_related(
-                "service", "spa_center", "sender", "service_arrangement",
-            ).get(public_token=public_token)
-        except GiftCard.DoesNotExist:
+        gift_card = get_gift_card_by_token(
+            public_token,
+            GiftCard.objects.select_related(
+                "service", "spa_center", "spa_center__city", "spa_center__country",
+                "sender", "service_arrangement",
+            ),
+        )
+        if gift_card is None:
             return Response(
                 {"success": False, "message": "Gift card not found."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -809,6 +915,8 @@ class GiftCardValidityCheckView(APIView):
 
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
+    throttle_classes = [AnonRateThrottle, ScopedRateThrottle]
+    throttle_scope = "gift_card_lookup"
 
     def post(self, request):
         """
@@ -820,10 +928,7 @@ class GiftCardValidityCheckView(APIView):
         serializer = GiftCardValidityCheckSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        gift_card = GiftCard.objects.select_related(
-            "service", "spa_center", "spa_center__city", "spa_center__country",
-            "sender", "service_arrangement",
-        ).get(public_token=serializer.validated_data["public_token"])
+        gift_card = serializer.validated_data["gift_card"]
 
         return Response({
             "is_valid": gift_card.is_redeemable,
@@ -846,6 +951,8 @@ class GiftCardRedeemView(APIView):
 
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
+    throttle_classes = [AnonRateThrottle, ScopedRateThrottle]
+    throttle_scope = "gift_card_lookup"
 
     def post(self, request):
         """
@@ -862,46 +969,26 @@ class GiftCardRedeemView(APIView):
         serializer = GiftCardRedeemSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        public_token = serializer.validated_data["public_token"]
+        gift_card = serializer.validated_data["gift_card"]
         secret_code = serializer.validated_data["secret_code"]
 
-        gift_card = GiftCard.objects.select_related(
-            "service", "spa_center", "sender", "service_arrangement",
-        ).get(public_token=public_token)
-
         # Get or create recipient user
-        from accounts.models import User, UserType
-        from config.utils.sms_service import send_sms_async
-        
         recipient_user = gift_card.recipient
+        extra_update_fields = []
         if not recipient_user:
-            # Fallback for legacy gift cards without recipient FK
-            phone_number = gift_card.recipient_phone
-            recipient_user = User.objects.filter(phone_number=phone_number).first()
-        
-        if not recipient_user:
-            from django.utils.crypto import get_random_string
-            password = get_random_string(6)
-            recipient_user = User.objects.create_user(
-                phone_number=gift_card.recipient_phone,
-                password=password,
-                first_name=gift_card.recipient_name or "Recipient",
-                last_name="GiftUser",
-                user_type=UserType.CUSTOMER,
-                is_phone_verified=True
+            # Fallback for legacy gift cards without recipient FK. redeem()
+            # saves the link with the redemption or the failed attempt.
+            recipient_user, _ = get_or_create_recipient_user(
+                gift_card.recipient_phone, gift_card.recipient_name,
             )
-            message = (
-                f"Welcome to USH Spa! An account has been created for you. "
-                f"Your temporary password is: {password}. "
-                f"You can now login and manage your gift cards."
-            )
-            send_sms_async(str(gift_card.recipient_phone), message)
-            
-            # Link it to the gift card for future use
             gift_card.recipient = recipient_user
-            gift_card.save(update_fields=["recipient", "updated_at"])
+            extra_update_fields.append("recipient")
 
-        success, error = gift_card.redeem(secret_code=secret_code, redeemed_by_user=recipient_user)
+        success, error = gift_card.redeem(
+            secret_code=secret_code,
+            redeemed_by_user=recipient_user,
+            extra_update_fields=extra_update_fields,
+        )
 
         if not success:
             return Response(
@@ -928,27 +1015,47 @@ class UserGiftCardViewSet(viewsets.ReadOnlyModelViewSet):
 
     Lists gift cards where the recipient phone matches the
     authenticated user's phone number (i.e. gifts I received).
+    The list is page-number paginated; ``cursor/`` serves the same
+    cards with keyset pagination for deep scrolling.
     """
 
     serializer_class = GiftCardDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [
         django_filters.DjangoFilterBackend,
-        filters.OrderingFilter,
+        StrictOrderingFilter,
     ]
-    filterset_fields = ["status"]
-    ordering_fields = ["created_at", "status"]
+    filterset_class = GiftCardFilter
+    ordering_fields = ["created_at", "status", "expires_at", "amount"]
     ordering = ["-created_at"]
 
     def get_queryset(self):
-        return GiftCard.objects.filter(
-            recipient=self.request.user,
-        ).select_related(
-            "service", "spa_center", "spa_center__city", "spa_center__country",
-            "sender", "service_arrangement",
-        ).prefetch_related(
-            "gift_card_bookings", "gift_card_bookings__time_slot",
+        return self.serializer_class.setup_eager_loading(
+            GiftCard.objects.filter(recipient=self.request.user),
+        )
+
+    @action(detail=False, methods=["get"])
+    def cursor(self, request):
+        """
+        Received gift cards with cursor pagination, newest first.
+
+        Accepts the same filters as the list. ``ordering`` is rejected:
+        the cursor needs the fixed, non-null ``-created_at`` order, and a
+        nullable column such as expires_at would skip or repeat cards.
+        """
+        if "ordering" in request.query_params:
+            return Response(
+                {"error": "ordering is not supported with cursor pagination."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = django_filters.DjangoFilterBackend().filter_queryset(
+            request, self.get_queryset(), self
         )
+        paginator = GiftCardCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class SentGiftCardViewSet(viewsets.ReadOnlyModelViewSet):
@@ -964,18 +1071,13 @@ class SentGiftCardViewSet(viewsets.ReadOnlyModelViewSet):
         django_filters.DjangoFilterBackend,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["status"]
-    ordering_fields = ["created_at", "status"]
+    filterset_class = GiftCardFilter
+    ordering_fields = ["created_at", "status", "expires_at", "amount"]
     ordering = ["-created_at"]
 
     def get_queryset(self):
-        return GiftCard.objects.filter(
-            sender=self.request.user,
-        ).select_related(
-            "service", "spa_center", "spa_center__city", "spa_center__country",
-            "service_arrangement",
-        ).prefetch_related(
-            "gift_card_bookings", "gift_card_bookings__time_slot",
+        return self.serializer_class.setup_eager_loading(
+            GiftCard.objects.filter(sender=self.request.user),
         )
 
 
@@ -996,11 +1098,10 @@ class GiftCardFulfillView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, public_token):
-        try:
-            gift_card = GiftCard.objects.select_related(
-                "service", "spa_center",
-            ).get(public_token=public_token)
-        except GiftCard.DoesNotExist:
+        gift_card = GiftCard.objects.select_related(
+            "service", "spa_center",
+        ).filter(public_token=public_token).first()
+        if gift_card is None:
             return Response(
                 {"success": False, "message": "Gift card not found."},
                 status=status.HTTP_404_NOT_FOUND,
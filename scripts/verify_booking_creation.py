@@ -19,8 +19,9 @@ User = get_user_model()
 def run_test():
     print("Starting Booking Creation Logic Verification...")
     customer, _ = User.objects.get_or_create(email='test@example.com', defaults={'first_name': 'Test', 'last_name': 'Customer'})
-    spa = SpaCenter.objects.first()
-    service = Service.objects.filter(is_active=True).first()
+    # Only the ids are used here; the serializer loads what it needs itself.
+    spa = SpaCenter.objects.only("id").first()
+    service = Service.objects.filter(is_active=True).only("id").first()
     
     if not spa or not service:
         print("Error: Could not find SpaCenter or Service in database.")
@@ -9,6 +9,7 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 django.setup()
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework.test import APIRequestFactory, force_authenticate
 from orders.views import CartViewSet, OrderViewSet
 from spacenter.models import SpaCenter, Country, City, SpaProduct, BaseProduct, ProductCategory
@@ -23,39 +24,38 @@ def run_verification():
 
     # 1. Setup Data
     print("\n1. Setting up test data...")
-    user, _ = User.objects.get_or_create(email="testuser@example.com", defaults={
-        "first_name": "Test", 
-        "last_name": "User",
-        "password": "password123"
-    })
-    
-    country, _ = Country.objects.get_or_create(name="Test Country", code="TC")
-    city, _ = City.objects.get_or_create(name="Test City", country=country)
-    
-    category, _ = ProductCategory.objects.get_or_create(name="Test Category")
-    base_product, _ = BaseProduct.objects.get_or_create(
-        sku="TEST-SKU-001",
-        defaults={"name": "Test Product", "category": "Test Category"}
-    )
-    
-    if not base_product.name:
-         base_product.name = "Test Product"
-         base_product.category = "Test Category"
-         base_product.save()
+    with transaction.atomic():
+        user, _ = User.objects.get_or_create(email="testuser@example.com", defaults={
+            "first_name": "Test", 
+            "last_name": "User",
+            "password": "password123"
+        })
+        
+        country, _ = Country.objects.get_or_create(name="Test Country", code="TC")
+        city, _ = City.objects.get_or_create(name="Test City", country=country)
+        
+        category, _ = ProductCategory.objects.get_or_create(name="Test Category")
+        base_product, _ = BaseProduct.objects.get_or_create(
+            sku="TEST-SKU-001",
+            defaults={"name": "Test Product", "category": "Test Category"}
+        )
+        
+        if not base_product.name:
+             base_product.name = "Test Product"
+             base_product.category = "Test Category"
+             base_product.save()
 
-    spa_product, _ = SpaProduct.objects.get_or_create(
-        product=base_product,
-        country=country,
-        city=city,
-        defaults={
-            "price": Decimal("100.00"),
-            "quantity": 10
-        }
-    )
-    # Ensure stock is reset for test run
-    spa_product.quantity = 10
-    spa_product.reserved_quantity = 0
-    spa_product.save()
+        # Ensure stock is reset for test run
+        spa_product, _ = SpaProduct.objects.update_or_create(
+            product=base_product,
+            country=country,
+            city=city,
+            defaults={
+                "price": Decimal("100.00"),
+                "quantity": 10,
+                "reserved_quantity": 0,
+            }
+        )
 
     print(f"User: {user}")
     print(f"SPA Product: {spa_product} (Qty: {spa_product.quantity})")
@@ -6,11 +6,14 @@ Supports multi-language (English, Arabic) via django-modeltranslation.
 """
 
 from django.contrib import admin, messages
-from django.db.models import Sum
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from modeltranslation.admin import TranslationAdmin
 from simple_history.admin import SimpleHistoryAdmin
 
+from accounts.models import UserType
 from config.cache_utils import invalidate_all_caches
 from config.admin_mixins import SpaCenterRestrictedAdminMixin
 
@@ -33,7 +36,40 @@ from .models import (
     Specialty
 )
 
-from .filters import CountryFilter, CityFilter, SpaCenterFilter, ServiceArrangementServiceFilter
+from .filters import CountryFilter, CityFilter, SpaCenterFilter, ServiceFilter, SpecialtyFilter
+
+
+# =============================================================================
+# Shared changelist markup
+# =============================================================================
+
+_THUMBNAIL_TPL = '<img src="{}" style="max-height: 40px; max-width: 60px;" />'
+_DISCOUNT_PRICE_TPL = (
+    '<span style="text-decoration: line-through; color: #999;">{}</span> '
+    '<span style="color: green; font-weight: bold;">{}</span> '
+    '<span style="color: red;">(-{}%)</span>'
+)
+_ZERO_STOCK_HTML = mark_safe('<span style="color: red;">0</span>')
+_OUT_OF_STOCK_HTML = mark_safe('<span style="color: red;">Out of Stock</span>')
+_LOW_STOCK_HTML = mark_safe('<span style="color: orange;">Low Stock</span>')
+_IN_STOCK_HTML = mark_safe('<span style="color: green;">In Stock</span>')
+
+
+def _display_price(price_field, discount_field):
+    """Price shown in the changelist, matching the models' ``current_price``."""
+    # current_price uses the discount whenever it is set and non-zero
+    has_discount_price = Q(**{f"{discount_field}__isnull": False}) & ~Q(**{discount_field: 0})
+    return Case(
+        When(has_discount_price, then=F(discount_field)),
+        default=F(price_field),
+    )
+
+
+def _is_changelist(request, model_admin):
+    """Return True when the request renders the admin's changelist page."""
+    opts = model_admin.model._meta
+    match = request.resolver_match
+    return bool(match) and match.url_name == f"{opts.app_label}_{opts.model_name}_changelist"
 
 
 # =============================================================================
@@ -124,9 +160,14 @@ class CountryAdmin(ClearCacheActionMixin, TranslationAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Annotate city counts so the changelist does not query per row."""
+        return super().get_queryset(request).annotate(_city_count=Count("cities"))
+
     def city_count(self, obj):
-        return obj.cities.count()
+        return obj._city_count
     city_count.short_description = "Cities"
+    city_count.admin_order_field = "_city_count"
 
 
 @admin.register(City)
@@ -134,7 +175,7 @@ class CityAdmin(ClearCacheActionMixin, TranslationAdmin):
     """Admin for City model with translation support."""
 
     list_display = ["name", "country", "state", "is_active", "sort_order"]
-    list_filter = ["is_active", "country"]
+    list_filter = ["is_active", CountryFilter]
     search_fields = ["name", "name_en", "name_ar", "state", "country__name"]
     ordering = ["country", "sort_order", "name"]
     list_editable = ["sort_order", "is_active"]
@@ -172,9 +213,14 @@ class SpecialtyAdmin(ClearCacheActionMixin, TranslationAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Annotate service counts so the changelist does not query per row."""
+        return super().get_queryset(request).annotate(_service_count=Count("services"))
+
     def service_count(self, obj):
-        return obj.services.count()
+        return obj._service_count
     service_count.short_description = "Services"
+    service_count.admin_order_field = "_service_count"
 
 
 @admin.register(AddOnService)
@@ -215,26 +261,33 @@ class AddOnServiceAdmin(ClearCacheActionMixin, TranslationAdmin):
         }),
     )
 
-    def service_count(self, obj):
-        """Count of services using this add-on."""
-        from django.db.models import Q
-        from spacenter.models import Service
-        return Service.objects.filter(
+    def get_queryset(self, request):
+        """Annotate service usage so the changelist does not query per row."""
+        used_in = Service.objects.filter(
             is_active=True,
             arrangement_prices__service_arrangement__is_active=True
         ).filter(
             Q(arrangement_prices__service_arrangement__add_ons__isnull=True) |
-            Q(arrangement_prices__service_arrangement__add_ons__add_on_services=obj)
-        ).distinct().count()
+            Q(arrangement_prices__service_arrangement__add_ons__add_on_services=OuterRef("pk"))
+        ).order_by().annotate(
+            _group=Value(1)
+        ).values("_group").annotate(
+            count=Count("pk", distinct=True)
+        ).values("count")
+        return super().get_queryset(request).annotate(
+            _service_count=Coalesce(Subquery(used_in), 0)
+        )
+
+    def service_count(self, obj):
+        """Count of services using this add-on."""
+        return obj._service_count
     service_count.short_description = "Used In"
+    service_count.admin_order_field = "_service_count"
 
     def image_preview(self, obj):
         """Display image thumbnail."""
         if obj.image:
-            return format_html(
-                '<img src="{}" style="max-height: 40px; max-width: 60px;" />',
-                obj.image.url
-            )
+            return format_html(_THUMBNAIL_TPL, obj.image.url)
         return "-"
     image_preview.short_description = "Image"
 
@@ -270,7 +323,7 @@ class ServiceAdmin(SpaCenterRestrictedAdminMixin, ClearCacheActionMixin, SimpleH
         "sort_order",
         "image_count",
     ]
-    list_filter = [CountryFilter, CityFilter, SpaCenterFilter, "is_active", "is_eligible_for_loyalty", "is_for_male", "is_for_female", "specialty"]
+    list_filter = [CountryFilter, CityFilter, SpaCenterFilter, "is_active", "is_eligible_for_loyalty", "is_for_male", "is_for_female", SpecialtyFilter]
     search_fields = ["name", "name_en", "name_ar", "description", "ideal_for", "spa_center__name"]
     ordering = ["sort_order", "name"]
     list_editable = ["sort_order", "is_active", "is_eligible_for_loyalty"]
@@ -310,22 +363,39 @@ class ServiceAdmin(SpaCenterRestrictedAdminMixin, ClearCacheActionMixin, SimpleH
     def current_price_display(self, obj):
         if obj.has_discount:
             return format_html(
-                '<span style="text-decoration: line-through; color: #999;">{}</span> '
-                '<span style="color: green; font-weight: bold;">{}</span> '
-                '<span style="color: red;">(-{}%)</span>',
+                _DISCOUNT_PRICE_TPL,
                 obj.base_price,
-                obj.current_price,
+                obj._display_price,
                 obj.discount_percentage
             )
-        return obj.base_price
+        return obj._display_price
     current_price_display.short_description = "Current Price"
+    current_price_display.admin_order_field = "_display_price"
+
+    changelist_deferred_fields = [
+        "description", "description_en", "description_ar",
+        "ideal_for", "ideal_for_en", "ideal_for_ar",
+        "session_benefits", "session_benefits_en", "session_benefits_ar",
+        "benefits",
+    ]
+
+    def get_queryset(self, request):
+        """Annotate image counts so the changelist does not query per row."""
+        qs = super().get_queryset(request).annotate(
+            _image_count=Count("images"),
+            _display_price=_display_price("base_price", "discount_price"),
+        )
+        if _is_changelist(request, self):
+            qs = qs.defer(*self.changelist_deferred_fields)
+        return qs
 
     def image_count(self, obj):
-        count = obj.images.count()
+        count = obj._image_count
         if count < 1:
             return format_html('<span style="color: red;">0 (Required!)</span>')
         return count
     image_count.short_description = "Images"
+    image_count.admin_order_field = "_image_count"
 
     def booking_count_display(self, obj):
         """Styled booking count badge."""
@@ -355,8 +425,9 @@ class ServiceImageAdmin(ClearCacheActionMixin, admin.ModelAdmin):
     """Admin for ServiceImage model."""
 
     list_display = ["service", "image_preview", "is_primary", "sort_order"]
-    list_filter = ["is_primary", "service"]
+    list_filter = ["is_primary", ServiceFilter]
     ordering = ["service", "sort_order"]
+    autocomplete_fields = ["service"]
 
     def image_preview(self, obj):
         if obj.image:
@@ -448,15 +519,27 @@ class SpaCenterAdmin(SpaCenterRestrictedAdminMixin, ClearCacheActionMixin, Simpl
     )
 
 
+    def _cached_country_id(self, request, object_id):
+        """Fetch the edited spa center's country id once per request."""
+        if not hasattr(request, "_sc_country_id"):
+            request._sc_country_id = (
+                self.get_queryset(request)
+                .filter(pk=object_id)
+                .values_list("country_id", flat=True)
+                .first()
+            )
+        return request._sc_country_id
+
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         """Filter city choices based on selected country."""
         if db_field.name == "city":
             # Get country from request if available
-            if request.resolver_match.kwargs.get("object_id"):
+            object_id = request.resolver_match.kwargs.get("object_id")
+            if object_id:
                 try:
-                    obj = self.get_object(request, request.resolver_match.kwargs["object_id"])
-                    if obj and obj.country:
-                        kwargs["queryset"] = City.objects.filter(country=obj.country)
+                    country_id = self._cached_country_id(request, object_id)
+                    if country_id:
+                        kwargs["queryset"] = City.objects.filter(country_id=country_id)
                 except Exception:
                     pass
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
@@ -473,7 +556,7 @@ class SpaCenterOperatingHoursAdmin(admin.ModelAdmin):
         "closing_time",
         "is_closed",
     ]
-    list_filter = ["spa_center", "day_of_week", "is_closed"]
+    list_filter = [SpaCenterFilter, "day_of_week", "is_closed"]
     ordering = ["spa_center", "day_of_week"]
 
 
@@ -523,11 +606,17 @@ class RoomAdmin(ClearCacheActionMixin, admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Annotate active arrangement counts so the changelist does not query per row."""
+        return super().get_queryset(request).annotate(
+            _arrangement_count=Count("arrangements", filter=Q(arrangements__is_active=True)),
+        )
+
     def arrangement_count(self, obj):
         """Display number of arrangements linked to this room."""
-        count = obj.arrangements.filter(is_active=True).count()
-        return count
+        return obj._arrangement_count
     arrangement_count.short_description = "Active Arrangements"
+    arrangement_count.admin_order_field = "_arrangement_count"
 
 
 class ServiceArrangementPriceInline(admin.TabularInline):
@@ -551,7 +640,7 @@ class ServiceArrangementAddOnInline(admin.StackedInline):
     min_num = 0        # No minimum — the whole section is optional
     max_num = 1
     can_delete = True  # Allow removing the add-on whitelist if it was previously set
-    filter_horizontal = ["add_on_services"]
+    autocomplete_fields = ["add_on_services"]
     verbose_name = "Add-on Service Whitelist (optional)"
     verbose_name_plural = "Add-on Services (optional — leave empty to allow all active add-ons)"
 
@@ -595,7 +684,7 @@ class ServiceArrangementAdmin(SpaCenterRestrictedAdminMixin, ClearCacheActionMix
 @admin.register(ServiceArrangementPrice)
 class ServiceArrangementPriceAdmin(ClearCacheActionMixin, admin.ModelAdmin):
     list_display = ["service_arrangement", "service", "price", "discounted_price", "extra_minutes", "price_for_extra_minutes"]
-    list_filter = ["service", "extra_minutes"]
+    list_filter = [ServiceFilter, "extra_minutes"]
     search_fields = ["service_arrangement__arrangement_label", "service__name"]
 
 
@@ -603,7 +692,7 @@ class ServiceArrangementPriceAdmin(ClearCacheActionMixin, admin.ModelAdmin):
 class ServiceArrangementAddOnAdmin(ClearCacheActionMixin, admin.ModelAdmin):
     list_display = ["service_arrangement"]
     search_fields = ["service_arrangement__arrangement_label"]
-    filter_horizontal = ["add_on_services"]
+    autocomplete_fields = ["service_arrangement", "add_on_services"]
 
 
 
@@ -704,27 +793,35 @@ class BaseProductAdmin(ClearCacheActionMixin, TranslationAdmin):
         }),
     )
 
+    changelist_deferred_fields = [
+        "short_description", "short_description_en", "short_description_ar",
+    ]
+
+    def get_queryset(self, request):
+        """Skip long text columns on the changelist."""
+        qs = super().get_queryset(request)
+        if _is_changelist(request, self):
+            qs = qs.defer(*self.changelist_deferred_fields)
+        return qs
+
     def total_stock_display(self, obj):
         """Display total stock across all locations."""
-        total = obj.stocks.aggregate(total=Sum("quantity"))["total"] or 0
-        if total == 0:
-            return format_html('<span style="color: red;">0</span>')
-        return total
+        if obj.total_stock == 0:
+            return _ZERO_STOCK_HTML
+        return obj.total_stock
     total_stock_display.short_description = "Total Stock"
+    total_stock_display.admin_order_field = "total_stock"
 
     def locations_count_display(self, obj):
         """Display number of locations with stock."""
-        count = obj.stocks.filter(quantity__gt=0).count()
-        return count
+        return obj.locations_in_stock
     locations_count_display.short_description = "Locations"
+    locations_count_display.admin_order_field = "locations_in_stock"
 
     def image_preview(self, obj):
         """Display image preview."""
         if obj.image:
-            return format_html(
-                '<img src="{}" style="max-height: 40px; max-width: 60px;" />',
-                obj.image.url
-            )
+            return format_html(_THUMBNAIL_TPL, obj.image.url)
         return "-"
     image_preview.short_description = "Image"
 
@@ -785,47 +882,69 @@ class SpaProductAdmin(ClearCacheActionMixin, admin.ModelAdmin):
         """Display current price with discount indicator."""
         if obj.has_discount:
             return format_html(
-                '<span style="text-decoration: line-through; color: #999;">{}</span> '
-                '<span style="color: green; font-weight: bold;">{}</span> '
-                '<span style="color: red;">(-{}%)</span>',
+                _DISCOUNT_PRICE_TPL,
                 obj.price,
-                obj.current_price,
+                obj._display_price,
                 obj.discount_percentage
             )
-        return obj.price
+        return obj._display_price
     current_price_display.short_description = "Current Price"
+    current_price_display.admin_order_field = "_display_price"
+
+    def get_queryset(self, request):
+        """
+        Annotate display price and available stock for the changelist.
+
+        Branch managers only see products in their spa center's city.
+        """
+        qs = super().get_queryset(request).annotate(
+            _display_price=_display_price("price", "discounted_price"),
+            _available=Greatest(F("quantity") - F("reserved_quantity"), Value(0)),
+        )
+        if self._is_branch_manager(request):
+            spa_center = request.user.spa_center
+            if spa_center is None:
+                # Manager but no spa center assigned - see nothing
+                return qs.none()
+            qs = qs.filter(country_id=spa_center.country_id, city_id=spa_center.city_id)
+        return qs
 
     def available_display(self, obj):
         """Display available quantity."""
-        available = obj.available_quantity
+        available = obj._available
         if available == 0:
-            return format_html('<span style="color: red;">0</span>')
-        elif obj.is_low_stock:
+            return _ZERO_STOCK_HTML
+        elif available <= obj.low_stock_threshold:
             return format_html('<span style="color: orange;">{}</span>', available)
         return available
     available_display.short_description = "Available"
+    available_display.admin_order_field = "_available"
 
     def stock_status_display(self, obj):
         """Display stock status with color coding."""
-        status = obj.stock_status
-        if status == "out_of_stock":
-            return format_html('<span style="color: red;">Out of Stock</span>')
-        elif status == "low_stock":
-            return format_html('<span style="color: orange;">Low Stock</span>')
-        return format_html('<span style="color: green;">In Stock</span>')
+        available = obj._available
+        if available == 0:
+            return _OUT_OF_STOCK_HTML
+        elif available <= obj.low_stock_threshold:
+            return _LOW_STOCK_HTML
+        return _IN_STOCK_HTML
     stock_status_display.short_description = "Status"
-    def formfield_for_foreignkey(self, db_field, request, **kwargs):
-        """Standard formfield filtering."""
-        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+    stock_status_display.admin_order_field = "_available"
+
+    @staticmethod
+    def _is_branch_manager(request):
+        return (
+            not request.user.is_superuser
+            and request.user.user_type == UserType.BRANCH_MANAGER
+        )
 
     def save_model(self, request, obj, form, change):
         """Auto-set country/city for branch managers on create."""
-        if not change and not request.user.is_superuser:
-            if hasattr(request.user, 'managed_spa_center'):
-                spa_center = request.user.managed_spa_center
-                if spa_center:
-                    obj.country = spa_center.country
-                    obj.city = spa_center.city
+        if not change and self._is_branch_manager(request):
+            spa_center = request.user.spa_center
+            if spa_center:
+                obj.country_id = spa_center.country_id
+                obj.city_id = spa_center.city_id
         super().save_model(request, obj, form, change)
 
 
@@ -847,7 +966,7 @@ class HomeServiceAdmin(ClearCacheActionMixin, TranslationAdmin):
         "is_active",
         "image_preview",
     ]
-    list_filter = [CountryFilter, CityFilter, "is_active", "is_for_male", "is_for_female", "specialty"]
+    list_filter = [CountryFilter, CityFilter, "is_active", "is_for_male", "is_for_female", SpecialtyFilter]
     search_fields = ["name", "name_en", "name_ar", "description"]
     ordering = ["-created_at"]
     list_editable = ["is_active"]
@@ -874,25 +993,27 @@ class HomeServiceAdmin(ClearCacheActionMixin, TranslationAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Annotate the display price so the column sorts in SQL."""
+        return super().get_queryset(request).annotate(
+            _display_price=_display_price("price", "discount_price"),
+        )
+
     def current_price_display(self, obj):
         if obj.has_discount:
             return format_html(
-                '<span style="text-decoration: line-through; color: #999;">{}</span> '
-                '<span style="color: green; font-weight: bold;">{}</span> '
-                '<span style="color: red;">(-{}%)</span>',
+                _DISCOUNT_PRICE_TPL,
                 obj.price,
-                obj.current_price,
+                obj._display_price,
                 obj.discount_percentage
             )
-        return obj.price
+        return obj._display_price
     current_price_display.short_description = "Current Price"
+    current_price_display.admin_order_field = "_display_price"
 
     def image_preview(self, obj):
         if obj.image:
-            return format_html(
-                '<img src="{}" style="max-height: 40px; max-width: 60px;" />',
-                obj.image.url
-            )
+            return format_html(_THUMBNAIL_TPL, obj.image.url)
         return "-"
     image_preview.short_description = "Image"
 
@@ -1,6 +1,4 @@
 from admin_searchable_dropdown.filters import AutocompleteFilter
-from django.contrib.admin import SimpleListFilter
-from django.utils.translation import gettext_lazy as _
 
 
 class CountryFilter(AutocompleteFilter):
@@ -17,6 +15,12 @@ class SpaCenterFilter(AutocompleteFilter):
     title = 'Spa Center'
     field_name = 'spa_center'
 
-class ServiceArrangementServiceFilter(AutocompleteFilter):
-    title = 'Service' # display title
-    field_name = 'allowed_services' # name of the foreign key field
\ No newline at end of file
+class ServiceFilter(AutocompleteFilter):
+    """Filter by service (FK relationship)."""
+    title = 'Service'
+    field_name = 'service'
+
+class SpecialtyFilter(AutocompleteFilter):
+    """Filter by specialty (FK relationship)."""
+    title = 'Specialty'
+    field_name = 'specialty'
@@ -2,12 +2,23 @@
 Master seed command – runs all seed commands in dependency order.
 
 Usage:
-    python manage.py seed_all           # Seed everything (additive)
-    python manage.py seed_all --clear   # Clear + re-seed everything
+    python manage.py seed_all               # Seed everything (additive)
+    python manage.py seed_all --clear       # Clear + re-seed everything
+    python manage.py seed_all --workers 3   # Run independent commands concurrently
+    python manage.py seed_all --no-image-cache  # Re-download seed images
+    python manage.py seed_all --clear --atomic  # All-or-nothing re-seed
+    python manage.py seed_all --thumbs      # Store small WebP images (dev/demo)
 """
 
-from django.core.management import call_command
+import io
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+
+from django.core.management import call_command, get_commands, load_command_class
 from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+
+from config.utils.seed_images import prefetch_images
 
 
 # Ordered list of (app_label.command_name, display_label)
@@ -15,10 +26,28 @@ SEED_COMMANDS = [
     ("seed_users", "👤 Users (accounts)"),
     ("seed_spacenter", "🏢 Spa Centers, Services & Products (spacenter)"),
     ("seed_products_homeservices", "🛍️  Products & Home Services (spacenter)"),
-    ("seed_profiles", "📋 Profiles & Schedules (profiles)"),
     ("seed_slides", "🖼️  Slides (profiles)"),
 ]
 
+# Commands that must finish before the keyed command can start
+SEED_DEPENDENCIES = {
+    "seed_products_homeservices": ["seed_spacenter"],
+}
+
+# Commands that download images and accept --thumbs
+IMAGE_SEED_COMMANDS = {"seed_spacenter", "seed_products_homeservices", "seed_slides"}
+
+
+def _run_in_thread(command_name, cmd_args):
+    """Run a seed command on a worker thread and return its captured output."""
+    out = io.StringIO()
+    try:
+        with transaction.atomic():
+            call_command(command_name, *cmd_args, stdout=out)
+    finally:
+        connections.close_all()
+    return out.getvalue()
+
 
 class Command(BaseCommand):
     help = "Run all seed commands in dependency order"
@@ -38,7 +67,28 @@ class Command(BaseCommand):
             "--skip",
             type=str,
             nargs="+",
-            help="Skip specific seed commands (e.g., --skip seed_payments seed_bookings)",
+            help="Skip specific seed commands (e.g., --skip seed_slides seed_products_homeservices)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Run independent seed commands concurrently on this many threads",
+        )
+        parser.add_argument(
+            "--atomic",
+            action="store_true",
+            help="Run all seed commands in a single transaction (rolled back entirely on error)",
+        )
+        parser.add_argument(
+            "--no-image-cache",
+            action="store_true",
+            help="Re-download all seed images into the local image cache before seeding",
+        )
+        parser.add_argument(
+            "--thumbs",
+            action="store_true",
+            help="Store downloaded images as 400px WebP thumbnails (passed to image seed commands)",
         )
 
     def handle(self, *args, **options):
@@ -75,24 +125,46 @@ class Command(BaseCommand):
         for command_name, label in commands_to_run:
             if command_name in skip:
                 self.stdout.write(f"\n⏭️  Skipping: {label}")
-                continue
-
-            self.stdout.write(
-                self.style.HTTP_INFO(f"\n{'─' * 50}\n{label}\n{'─' * 50}")
-            )
-
-            try:
-                cmd_args = []
-                if clear:
-                    cmd_args.append("--clear")
 
-                call_command(command_name, *cmd_args, stdout=self.stdout)
-
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f"\n❌ Error in {command_name}: {e}")
-                )
-                raise
+        commands_to_run = [(cmd, label) for cmd, label in commands_to_run if cmd not in skip]
+        cmd_args = ["--clear"] if clear else []
+        image_args = ["--thumbs"] if options["thumbs"] else []
+        args_by_command = {
+            cmd: cmd_args + (image_args if cmd in IMAGE_SEED_COMMANDS else [])
+            for cmd, _ in commands_to_run
+        }
+
+        self._prefetch_images(args_by_command, refresh=options["no_image_cache"])
+
+        workers = options["workers"]
+        if workers > 1 and clear:
+            # Clears delete across apps (e.g. bookings before users), so they
+            # only stay consistent when run in order.
+            self.stdout.write(self.style.WARNING("\n--workers is ignored with --clear"))
+            workers = 1
+        if workers > 1 and options["atomic"]:
+            # A transaction cannot span the worker threads.
+            self.stdout.write(self.style.WARNING("\n--workers is ignored with --atomic"))
+            workers = 1
+
+        if workers > 1:
+            self._run_concurrently(commands_to_run, args_by_command, workers)
+        else:
+            # Each command runs in its own transaction: the seeders issue
+            # thousands of small writes, and committing once per command
+            # avoids a WAL flush per row while keeping the work of earlier
+            # commands if a later one fails. --atomic uses one transaction
+            # for the whole run instead. Postgres FKs created by Django are
+            # already deferred to commit.
+            with transaction.atomic() if options["atomic"] else nullcontext():
+                for command_name, label in commands_to_run:
+                    self._write_header(label)
+                    try:
+                        with transaction.atomic():
+                            call_command(command_name, *args_by_command[command_name], stdout=self.stdout)
+                    except Exception as e:
+                        self._write_error(command_name, e)
+                        raise
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -102,3 +174,59 @@ class Command(BaseCommand):
                 + "\n"
             )
         )
+
+    def _run_concurrently(self, commands_to_run, args_by_command, workers):
+        """Run commands on a thread pool, starting each once its dependencies finish."""
+        labels = dict(commands_to_run)
+        pending = [cmd for cmd, _ in commands_to_run]
+        done = set()
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while pending or running:
+                for command_name in list(pending):
+                    deps = [d for d in SEED_DEPENDENCIES.get(command_name, []) if d in labels]
+                    if all(d in done for d in deps):
+                        pending.remove(command_name)
+                        future = executor.submit(_run_in_thread, command_name, args_by_command[command_name])
+                        running[future] = command_name
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    command_name = running.pop(future)
+                    self._write_header(labels[command_name])
+                    try:
+                        self.stdout.write(future.result())
+                    except Exception as e:
+                        self._write_error(command_name, e)
+                        raise
+                    done.add(command_name)
+
+    def _prefetch_images(self, commands, refresh=False):
+        """
+        Fill the seed image cache before any command opens its transaction.
+
+        The commands then read images from disk instead of holding a
+        transaction open across HTTP requests. With ``refresh``
+        (--no-image-cache) every image is downloaded again into the cache
+        here rather than inside the commands.
+        """
+        urls = []
+        for command_name in commands:
+            if command_name in IMAGE_SEED_COMMANDS:
+                command = load_command_class(get_commands()[command_name], command_name)
+                urls.extend(getattr(command, "seed_image_urls", []))
+        if urls:
+            fetched = prefetch_images(urls, refresh=refresh)
+            if fetched:
+                self.stdout.write(f"\n📥 Downloaded {fetched} seed image(s) into the local cache")
+
+    def _write_header(self, label):
+        self.stdout.write(
+            self.style.HTTP_INFO(f"\n{'─' * 50}\n{label}\n{'─' * 50}")
+        )
+
+    def _write_error(self, command_name, error):
+        self.stdout.write(
+            self.style.ERROR(f"\n❌ Error in {command_name}: {error}")
+        )
@@ -14,12 +14,20 @@ Usage:
 
 import io
 import random
-import urllib.request
 from decimal import Decimal
 
 from django.core.files.base import ContentFile
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
+from config.cache_utils import (
+    HOME_SERVICE_CACHE_PREFIX,
+    SPA_PRODUCT_CACHE_PREFIX,
+    invalidate_all_caches,
+    invalidate_model_cache,
+)
+from config.utils.seed_images import download_images_bulk
+from config.utils.seeding import muted_delete_signals
 from spacenter.models import (
     BaseProduct,
     City,
@@ -59,16 +67,6 @@ def _make_placeholder_image(label="Product", width=800, height=600, color=(64, 1
         return _minimal_png(*color)
 
 
-def _download_image(url, timeout=15):
-    """Download an image from a URL. Returns bytes or None on failure."""
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read()
-    except Exception:
-        return None
-
-
 # ═══════════════════════════════════════════════════════════════════
 # DATA – Product Categories
 # ═══════════════════════════════════════════════════════════════════
@@ -164,18 +162,27 @@ CURRENCY_MAP = {"QAT": "QAR", "KWT": "KWD", "ARE": "AED"}
 
 class Command(BaseCommand):
     help = "Seed products (categories, base products, spa products) and home services with Arabic translations"
+    # Every URL this command may download; seed_all prefetches them
+    seed_image_urls = [*PRODUCT_IMAGE_URLS.values(), *HOME_SERVICE_IMAGE_URLS.values()]
 
     def add_arguments(self, parser):
         parser.add_argument("--clear", action="store_true", help="Clear existing data before seeding")
+        parser.add_argument("--no-image-cache", action="store_true", help="Re-download images instead of using the local image cache")
+        parser.add_argument("--thumbs", action="store_true", help="Store downloaded images as 400px WebP thumbnails instead of the originals")
 
     def handle(self, *args, **options):
+        self.use_image_cache = not options["no_image_cache"]
+        self.thumbs = options["thumbs"]
+        self.image_ext = "webp" if self.thumbs else "jpg"
         if options["clear"]:
             self.stdout.write("Clearing products and home services data...")
-            # Clear in dependency order
-            SpaProduct.objects.all().delete()
-            BaseProduct.objects.all().delete()
-            ProductCategory.objects.all().delete()
-            HomeService.objects.all().delete()
+            # Clear in dependency order, without per-row cache/stock receivers
+            with muted_delete_signals():
+                SpaProduct.objects.all().delete()
+                BaseProduct.objects.all().delete()
+                ProductCategory.objects.all().delete()
+                HomeService.objects.all().delete()
+            invalidate_all_caches()
 
         self._seed_product_categories()
         self._seed_base_products()
@@ -197,6 +204,7 @@ class Command(BaseCommand):
     # ── Base Products ──────────────────────────────────────────
     def _seed_base_products(self):
         self.stdout.write("\nSeeding base products...")
+        missing_images = []
         for d in BASE_PRODUCTS:
             obj, created = BaseProduct.objects.update_or_create(
                 sku=d["sku"],
@@ -209,28 +217,41 @@ class Command(BaseCommand):
                 },
             )
 
-            # Download and save product image if none exists
             if not obj.image:
-                img_url = PRODUCT_IMAGE_URLS.get(d["sku"])
-                img_data = None
-                file_ext = "jpg"
-
-                if img_url:
-                    self.stdout.write(f"    Downloading image for: {obj.name}...")
-                    img_data = _download_image(img_url)
-
-                if not img_data:
-                    color = PRODUCT_COLORS.get(d["sku"], (100, 130, 160))
-                    img_data = _make_placeholder_image(d["name_en"], color=color)
-                    file_ext = "png"
-                    self.stdout.write(self.style.WARNING(f"    ⚠ Download failed, using placeholder for: {obj.name}"))
-
-                fname = f"product_{obj.id}.{file_ext}"
-                obj.image.save(fname, ContentFile(img_data), save=True)
-                self.stdout.write(f"    Image saved for: {obj.name}")
+                missing_images.append((obj, d, PRODUCT_IMAGE_URLS.get(d["sku"])))
 
             self.stdout.write(f"  {'Created' if created else 'Updated'}: {obj.name}")
 
+        # Download and save product images for products that have none
+        if missing_images:
+            self.stdout.write(f"  Downloading {len(missing_images)} product image(s)...")
+        images = download_images_bulk(
+            [url for _, _, url in missing_images],
+            use_cache=self.use_image_cache,
+            thumbs=self.thumbs,
+        )
+        now = timezone.now()
+        for obj, d, url in missing_images:
+            img_data = images.get(url)
+            file_ext = self.image_ext
+
+            if not img_data:
+                color = PRODUCT_COLORS.get(d["sku"], (100, 130, 160))
+                img_data = _make_placeholder_image(d["name_en"], color=color)
+                file_ext = "png"
+                self.stdout.write(self.style.WARNING(f"    ⚠ Download failed, using placeholder for: {obj.name}"))
+
+            fname = f"product_{obj.id}.{file_ext}"
+            obj.image.save(fname, ContentFile(img_data), save=False)
+            obj.updated_at = now
+            self.stdout.write(f"    Image saved for: {obj.name}")
+        # Store all new image paths in one bulk UPDATE
+        if missing_images:
+            BaseProduct.objects.bulk_update(
+                [obj for obj, _, _ in missing_images], ["image", "updated_at"], batch_size=500
+            )
+            invalidate_model_cache(SPA_PRODUCT_CACHE_PREFIX)
+
     # ── Spa Products (stock per location) ──────────────────────
     def _seed_spa_products(self):
         self.stdout.write("\nSeeding spa products...")
@@ -249,52 +270,74 @@ class Command(BaseCommand):
     # ── Home Services ──────────────────────────────────────────
     def _seed_home_services(self):
         self.stdout.write("\nSeeding home services...")
+        specialties = {s.name_en: s for s in Specialty.objects.all()}
+        missing_images = []
+
+        # Stream every city with its country in one query rather than
+        # loading the cities of each country separately
+        cities = (
+            City.objects.select_related("country")
+            .order_by("country__sort_order", "sort_order")
+            .iterator(chunk_size=100)
+        )
+        for city in cities:
+            country = city.country
+            for hs in HOME_SERVICES:
+                specialty = specialties.get(hs["spec"])
+                if not specialty:
+                    self.stdout.write(self.style.WARNING(
+                        f"  ⚠ Specialty '{hs['spec']}' not found, skipping: {hs['name_en']}"
+                    ))
+                    continue
+
+                gender = random.choice(GENDER_OPTIONS)
+                obj, created = HomeService.objects.update_or_create(
+                    name_en=hs["name_en"], country=country, city=city,
+                    defaults={
+                        "name": hs["name_en"], "name_ar": hs["name_ar"],
+                        "description": hs["desc_en"], "description_en": hs["desc_en"], "description_ar": hs["desc_ar"],
+                        "specialty": specialty,
+                        "duration_minutes": hs["dur"],
+                        "price": hs["price"], "discount_price": hs["disc"],
+                        "is_for_male": gender[0], "is_for_female": gender[1],
+                    },
+                )
 
-        for country in Country.objects.all().order_by("sort_order"):
-            currency = CURRENCY_MAP.get(country.code, "QAR")
-            for city in country.cities.all().order_by("sort_order"):
-                for hs in HOME_SERVICES:
-                    specialty = Specialty.objects.filter(name_en=hs["spec"]).first()
-                    if not specialty:
-                        self.stdout.write(self.style.WARNING(
-                            f"  ⚠ Specialty '{hs['spec']}' not found, skipping: {hs['name_en']}"
-                        ))
-                        continue
-
-                    gender = random.choice(GENDER_OPTIONS)
-                    obj, created = HomeService.objects.update_or_create(
-                        name_en=hs["name_en"], country=country, city=city,
-                        defaults={
-                            "name": hs["name_en"], "name_ar": hs["name_ar"],
-                            "description": hs["desc_en"], "description_en": hs["desc_en"], "description_ar": hs["desc_ar"],
-                            "specialty": specialty,
-                            "duration_minutes": hs["dur"],
-                            "price": hs["price"], "discount_price": hs["disc"],
-                            "is_for_male": gender[0], "is_for_female": gender[1],
-                        },
-                    )
-
-                    # Assign image if none exists
-                    if not obj.image:
-                        img_url = HOME_SERVICE_IMAGE_URLS.get(hs["name_en"])
-                        img_data = None
-                        file_ext = "jpg"
-
-                        if img_url:
-                            self.stdout.write(f"    Downloading image for: {hs['name_en']}...")
-                            img_data = _download_image(img_url)
-
-                        if not img_data:
-                            color = HOME_SERVICE_COLORS.get(hs["name_en"], (100, 130, 160))
-                            img_data = _make_placeholder_image(hs["name_en"], color=color)
-                            file_ext = "png"
-                            self.stdout.write(self.style.WARNING(
-                                f"    ⚠ Download failed, using placeholder for: {hs['name_en']}"
-                            ))
-
-                        fname = f"home_service_{obj.id}.{file_ext}"
-                        obj.image.save(fname, ContentFile(img_data), save=True)
-                        self.stdout.write(f"    Image set for: {hs['name_en']}")
-
-                    status = "Created" if created else "Updated"
-                    self.stdout.write(f"  {status}: {obj.name} @ {city.name}, {country.name}")
+                if not obj.image:
+                    missing_images.append((obj, hs, HOME_SERVICE_IMAGE_URLS.get(hs["name_en"])))
+
+                status = "Created" if created else "Updated"
+                self.stdout.write(f"  {status}: {obj.name} @ {city.name}, {country.name}")
+
+        # Assign images where none exist. Every city shares the same home
+        # service URLs, so each one is only downloaded once.
+        if missing_images:
+            self.stdout.write(f"  Downloading images for {len(missing_images)} home service(s)...")
+        images = download_images_bulk(
+            [url for _, _, url in missing_images],
+            use_cache=self.use_image_cache,
+            thumbs=self.thumbs,
+        )
+        now = timezone.now()
+        for obj, hs, url in missing_images:
+            img_data = images.get(url)
+            file_ext = self.image_ext
+
+            if not img_data:
+                color = HOME_SERVICE_COLORS.get(hs["name_en"], (100, 130, 160))
+                img_data = _make_placeholder_image(hs["name_en"], color=color)
+                file_ext = "png"
+                self.stdout.write(self.style.WARNING(
+                    f"    ⚠ Download failed, using placeholder for: {hs['name_en']}"
+                ))
+
+            fname = f"home_service_{obj.id}.{file_ext}"
+            obj.image.save(fname, ContentFile(img_data), save=False)
+            obj.updated_at = now
+            self.stdout.write(f"    Image set for: {hs['name_en']}")
+        # Store all new image paths in one bulk UPDATE
+        if missing_images:
+            HomeService.objects.bulk_update(
+                [obj for obj, _, _ in missing_images], ["image", "updated_at"], batch_size=500
+            )
+            invalidate_model_cache(HOME_SERVICE_CACHE_PREFIX)
@@ -9,14 +9,29 @@ All translatable fields include both English and Arabic data.
 import io
 import random
 import os
-import urllib.request
 from datetime import time
 from decimal import Decimal
 
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.management.base import BaseCommand
-
+from django.db import transaction
+from django.utils import timezone
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
+
+from config.cache_utils import (
+    ADDON_SERVICE_CACHE_PREFIX,
+    CITY_CACHE_PREFIX,
+    COUNTRY_CACHE_PREFIX,
+    SERVICE_CACHE_PREFIX,
+    SPA_CENTER_CACHE_PREFIX,
+    SPA_PRODUCT_CACHE_PREFIX,
+    SPECIALTY_CACHE_PREFIX,
+    invalidate_all_caches,
+    invalidate_model_cache,
+)
+from config.utils.seed_images import download_images_bulk
+from config.utils.seeding import muted_delete_signals
 from spacenter.models import (
     AddOnService,
     BaseProduct,
@@ -26,6 +41,8 @@ from spacenter.models import (
     Room,
     Service,
     ServiceArrangement,
+    ServiceArrangementAddOn,
+    ServiceArrangementPrice,
     ServiceImage,
     SpaCenter,
     SpaCenterOperatingHours,
@@ -63,15 +80,6 @@ def _make_placeholder_image(label="Spa", width=800, height=600, color=(64, 130,
         return _minimal_png(*color)
 
 
-def _download_image(url, timeout=15):
-    """Download an image from a URL. Returns bytes or None on failure."""
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read()
-    except Exception:
-        return None
-
 # ═══════════════════════════════════════════════════════════════════
 # DATA
 # ═══════════════════════════════════════════════════════════════════
@@ -257,18 +265,38 @@ SPACENTER_COLORS = {
 
 class Command(BaseCommand):
     help = "Seed spa center data (countries, cities, centers, services, products, arrangements) with Arabic translations"
+    # Every URL this command may download; seed_all prefetches them
+    seed_image_urls = [*SPACENTER_IMAGE_URLS.values(), *SERVICE_IMAGE_URLS.values(), *PRODUCT_IMAGE_URLS.values()]
 
     def add_arguments(self, parser):
         parser.add_argument("--clear", action="store_true", help="Clear existing data before seeding")
+        parser.add_argument("--no-image-cache", action="store_true", help="Re-download images instead of using the local image cache")
+        parser.add_argument("--thumbs", action="store_true", help="Store downloaded images as 400px WebP thumbnails instead of the originals")
 
     def handle(self, *args, **options):
+        self.use_image_cache = not options["no_image_cache"]
+        self.thumbs = options["thumbs"]
+        self.image_ext = "webp" if self.thumbs else "jpg"
         if options["clear"]:
             self.stdout.write("Clearing spa center data...")
             from bookings.models import Booking, TimeSlot, ProductOrder, OrderItem
-            for M in [OrderItem, ProductOrder, Booking, TimeSlot,
-                      ServiceArrangement, Room, ServiceImage, SpaProduct, BaseProduct, ProductCategory,
-                      Service, AddOnService, Specialty, SpaCenterOperatingHours, SpaCenter, City, Country]:
-                M.objects.all().delete()
+            # Nothing references these once the earlier tables are gone, so
+            # they are removed with a plain DELETE instead of Django's
+            # cascade collector and per-row signals.
+            raw_delete = {OrderItem, ProductOrder, TimeSlot, Room, ServiceImage, SpaProduct,
+                          BaseProduct, ProductCategory, SpaCenterOperatingHours}
+            # The remaining cascades skip per-row cache/history receivers;
+            # caches are dropped once at the end instead.
+            with muted_delete_signals():
+                for M in [OrderItem, ProductOrder, Booking, TimeSlot,
+                          ServiceArrangement, Room, ServiceImage, SpaProduct, BaseProduct, ProductCategory,
+                          Service, AddOnService, Specialty, SpaCenterOperatingHours, SpaCenter, City, Country]:
+                    qs = M.objects.all()
+                    if M in raw_delete:
+                        qs._raw_delete(qs.db)
+                    else:
+                        qs.delete()
+            invalidate_all_caches()
 
         self._seed_countries()
         self._seed_cities()
@@ -285,164 +313,310 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS("\nSpa center seeding complete!"))
 
     # ── Countries ──────────────────────────────────────────────
+    # The reference tables below are upserted with one bulk statement each
+    # instead of an update_or_create round trip per row. bulk_create skips
+    # the post_save cache receivers, so their caches are dropped here.
     def _seed_countries(self):
         self.stdout.write("\nSeeding countries...")
+        existing = set(Country.objects.filter(code__in=[d["code"] for d in COUNTRIES]).values_list("code", flat=True))
+        Country.objects.bulk_create(
+            [
+                Country(code=d["code"], name=d["name_en"], name_en=d["name_en"], name_ar=d["name_ar"],
+                        phone_code=d["phone_code"], sort_order=d["sort_order"])
+                for d in COUNTRIES
+            ],
+            update_conflicts=True,
+            unique_fields=["code"],
+            update_fields=["name", "name_en", "name_ar", "phone_code", "sort_order", "updated_at"],
+        )
+        for prefix in (COUNTRY_CACHE_PREFIX, CITY_CACHE_PREFIX, SPA_CENTER_CACHE_PREFIX):
+            invalidate_model_cache(prefix)
         for d in COUNTRIES:
-            obj, created = Country.objects.update_or_create(
-                code=d["code"],
-                defaults={"name": d["name_en"], "name_en": d["name_en"], "name_ar": d["name_ar"],
-                           "phone_code": d["phone_code"], "sort_order": d["sort_order"]},
-            )
-            self.stdout.write(f"  {'Created' if created else 'Updated'}: {obj.name}")
+            self.stdout.write(f"  {'Updated' if d['code'] in existing else 'Created'}: {d['name_en']}")
 
     # ── Cities ─────────────────────────────────────────────────
     def _seed_cities(self):
         self.stdout.write("\nSeeding cities...")
-        for code, cities in CITIES.items():
-            country = Country.objects.get(code=code)
-            for i, c in enumerate(cities):
-                obj, created = City.objects.update_or_create(
-                    country=country, name_en=c["name_en"],
-                    defaults={"name": c["name_en"], "name_ar": c["name_ar"],
-                              "state": c["state_en"], "state_en": c["state_en"], "state_ar": c["state_ar"],
-                              "sort_order": i + 1},
-                )
-                self.stdout.write(f"  {'Created' if created else 'Updated'}: {obj}")
+        countries = {c.code: c for c in Country.objects.filter(code__in=CITIES)}
+        existing = set(City.objects.filter(country__in=countries.values()).values_list("country_id", "name_en"))
+        cities = [
+            City(country=countries[code], name_en=c["name_en"], name=c["name_en"], name_ar=c["name_ar"],
+                 state=c["state_en"], state_en=c["state_en"], state_ar=c["state_ar"], sort_order=i + 1)
+            for code, rows in CITIES.items()
+            for i, c in enumerate(rows)
+        ]
+        City.objects.bulk_create(
+            cities,
+            update_conflicts=True,
+            unique_fields=["country", "name_en"],
+            update_fields=["name", "name_ar", "state", "state_en", "state_ar", "sort_order", "updated_at"],
+        )
+        for prefix in (CITY_CACHE_PREFIX, SPA_CENTER_CACHE_PREFIX):
+            invalidate_model_cache(prefix)
+        for obj in cities:
+            status = "Updated" if (obj.country_id, obj.name_en) in existing else "Created"
+            self.stdout.write(f"  {status}: {obj}")
 
     # ── Specialties ────────────────────────────────────────────
     def _seed_specialties(self):
         self.stdout.write("\nSeeding specialties...")
-        for i, s in enumerate(SPECIALTIES):
-            obj, created = Specialty.objects.update_or_create(
-                name_en=s["name_en"],
-                defaults={"name": s["name_en"], "name_ar": s["name_ar"],
-                           "description": s["desc_en"], "description_en": s["desc_en"], "description_ar": s["desc_ar"],
-                           "sort_order": i + 1},
-            )
-            self.stdout.write(f"  {'Created' if created else 'Updated'}: {obj.name}")
+        names = [s["name_en"] for s in SPECIALTIES]
+        existing = set(Specialty.objects.filter(name_en__in=names).values_list("name_en", flat=True))
+        Specialty.objects.bulk_create(
+            [
+                Specialty(name_en=s["name_en"], name=s["name_en"], name_ar=s["name_ar"],
+                          description=s["desc_en"], description_en=s["desc_en"], description_ar=s["desc_ar"],
+                          sort_order=i + 1)
+                for i, s in enumerate(SPECIALTIES)
+            ],
+            update_conflicts=True,
+            unique_fields=["name_en"],
+            update_fields=["name", "name_ar", "description", "description_en", "description_ar",
+                           "sort_order", "updated_at"],
+        )
+        for prefix in (SPECIALTY_CACHE_PREFIX, SERVICE_CACHE_PREFIX):
+            invalidate_model_cache(prefix)
+        for name in names:
+            self.stdout.write(f"  {'Updated' if name in existing else 'Created'}: {name}")
 
     # ── Add-Ons ────────────────────────────────────────────────
     def _seed_addons(self):
         self.stdout.write("\nSeeding add-on services...")
+        # name_en is not unique on AddOnService, so split into inserts and
+        # updates instead of relying on ON CONFLICT
+        existing = {
+            a.name_en: a
+            for a in AddOnService.objects.filter(name_en__in=[a["name_en"] for a in ADDON_SERVICES])
+        }
+        now = timezone.now()
+        to_create, to_update = [], []
         for i, a in enumerate(ADDON_SERVICES):
-            obj, created = AddOnService.objects.update_or_create(
-                name_en=a["name_en"],
-                defaults={"name": a["name_en"], "name_ar": a["name_ar"],
-                           "description": a["desc_en"], "description_en": a["desc_en"], "description_ar": a["desc_ar"],
-                           "duration_minutes": a["dur"], "price": a["price"], "currency": "QAR",
-                           "sort_order": i + 1},
-            )
-            self.stdout.write(f"  {'Created' if created else 'Updated'}: {obj.name}")
+            defaults = {"name": a["name_en"], "name_ar": a["name_ar"],
+                        "description": a["desc_en"], "description_en": a["desc_en"], "description_ar": a["desc_ar"],
+                        "duration_minutes": a["dur"], "price": a["price"], "currency": "QAR",
+                        "sort_order": i + 1}
+            obj = existing.get(a["name_en"])
+            if obj is None:
+                to_create.append(AddOnService(name_en=a["name_en"], **defaults))
+            else:
+                for field, value in defaults.items():
+                    setattr(obj, field, value)
+                obj.updated_at = now
+                to_update.append(obj)
+        AddOnService.objects.bulk_create(to_create)
+        if to_update:
+            AddOnService.objects.bulk_update(to_update, [*defaults, "updated_at"])
+        invalidate_model_cache(ADDON_SERVICE_CACHE_PREFIX)
+        for obj in to_create:
+            self.stdout.write(f"  Created: {obj.name}")
+        for obj in to_update:
+            self.stdout.write(f"  Updated: {obj.name}")
 
     def _seed_branches(self):
         self.stdout.write("\nSeeding spa center branches...")
-
-        for country in Country.objects.all().order_by("sort_order"):
+        branches = []
+
+        # One narrow query for every city and its country instead of one per country
+        cities = (
+            City.objects.select_related("country")
+            .only(
+                "name_en", "name_ar", "sort_order", "country__code",
+                "country__phone_code", "country__name_en", "country__name_ar",
+            )
+            .order_by("country__sort_order", "sort_order")
+        )
+        for city in cities:
+            country = city.country
             info = BRANCH_TEMPLATE.get(country.code, {"currency": "QAR", "domain": "ushspa.com"})
-            for city in country.cities.all().order_by("sort_order"):
-                slug = f"ush-spa-{city.name_en.lower().replace(' ', '-')}"
-                name_en = f"USH Spa – {city.name_en}"
-                name_ar = f"يو إس إتش سبا – {city.name_ar}"
-                desc_en = f"Premium spa experience in {city.name_en}, {country.name_en}. World-class treatments and luxurious facilities."
-                desc_ar = f"تجربة سبا فاخرة في {city.name_ar}، {country.name_ar}. علاجات عالمية المستوى ومرافق فخمة."
-                addr_en = f"Main Boulevard, {city.name_en}"
-                addr_ar = f"الشارع الرئيسي، {city.name_ar}"
-
-                defaults = {
-                    "name": name_en, "name_en": name_en, "name_ar": name_ar,
-                    "description": desc_en, "description_en": desc_en, "description_ar": desc_ar,
-                    "address": addr_en, "address_en": addr_en, "address_ar": addr_ar,
-                    "country": country, "city": city,
-                    "phone": f"{country.phone_code}40001234",
-                    "email": f"{city.name_en.lower().replace(' ','')}@{info['domain']}",
-                    "default_opening_time": time(9, 0),
-                    "default_closing_time": time(22, 0),
-                    "sort_order": city.sort_order,
-                }
-                obj, created = SpaCenter.objects.update_or_create(slug=slug, defaults=defaults)
-                self.stdout.write(f"  {'Created' if created else 'Updated'}: {obj.name}")
-
-                # Assign image to spa center if none exists
-                if not obj.image:
-                    img_url = SPACENTER_IMAGE_URLS.get(city.name_en)
-                    img_data = None
-                    file_ext = "jpg"
-
-                    if img_url:
-                        self.stdout.write(f"    Downloading image for: {obj.name}...")
-                        img_data = _download_image(img_url)
-
-                    if not img_data:
-                        color = SPACENTER_COLORS.get(city.name_en, (80, 120, 150))
-                        img_data = _make_placeholder_image(f"USH Spa – {city.name_en}", width=1200, height=800, color=color)
-                        file_ext = "png"
-                        self.stdout.write(self.style.WARNING(f"    ⚠ Download failed, using placeholder for: {obj.name}"))
-
-                    fname = f"spacenter_{obj.id}.{file_ext}"
-                    obj.image.save(fname, ContentFile(img_data), save=True)
-                    self.stdout.write(f"    Image set for: {obj.name}")
+            slug = f"ush-spa-{city.name_en.lower().replace(' ', '-')}"
+            name_en = f"USH Spa – {city.name_en}"
+            name_ar = f"يو إس إتش سبا – {city.name_ar}"
+            desc_en = f"Premium spa experience in {city.name_en}, {country.name_en}. World-class treatments and luxurious facilities."
+            desc_ar = f"تجربة سبا فاخرة في {city.name_ar}، {country.name_ar}. علاجات عالمية المستوى ومرافق فخمة."
+            addr_en = f"Main Boulevard, {city.name_en}"
+            addr_ar = f"الشارع الرئيسي، {city.name_ar}"
+
+            defaults = {
+                "name": name_en, "name_en": name_en, "name_ar": name_ar,
+                "description": desc_en, "description_en": desc_en, "description_ar": desc_ar,
+                "address": addr_en, "address_en": addr_en, "address_ar": addr_ar,
+                "country": country, "city": city,
+                "phone": f"{country.phone_code}40001234",
+                "email": f"{city.name_en.lower().replace(' ','')}@{info['domain']}",
+                "default_opening_time": time(9, 0),
+                "default_closing_time": time(22, 0),
+                "sort_order": city.sort_order,
+            }
+            branches.append((slug, defaults, city))
+
+        # Insert new branches and update existing ones in bulk (with history)
+        # instead of an update_or_create round trip per branch.
+        existing = SpaCenter.objects.in_bulk([slug for slug, _, _ in branches], field_name="slug")
+        update_fields = [*branches[0][1], "updated_at"] if branches else []
+        now = timezone.now()
+        to_create, to_update, missing_images = [], [], []
+        for slug, defaults, city in branches:
+            obj = existing.get(slug)
+            if obj is None:
+                obj = SpaCenter(slug=slug, **defaults)
+                to_create.append(obj)
+            else:
+                for field, value in defaults.items():
+                    setattr(obj, field, value)
+                obj.updated_at = now
+                to_update.append(obj)
+            if not obj.image:
+                missing_images.append((obj, city, SPACENTER_IMAGE_URLS.get(city.name_en)))
+
+        with transaction.atomic():
+            bulk_create_with_history(to_create, SpaCenter, batch_size=500)
+            if to_update:
+                bulk_update_with_history(to_update, SpaCenter, fields=update_fields, batch_size=500)
+        for obj in to_create:
+            self.stdout.write(f"  Created: {obj.name}")
+        for obj in to_update:
+            self.stdout.write(f"  Updated: {obj.name}")
+
+        # Assign images to spa centers that have none, downloading in one batch
+        if missing_images:
+            self.stdout.write(f"  Downloading {len(missing_images)} spa center image(s)...")
+        images = download_images_bulk(
+            [url for _, _, url in missing_images],
+            use_cache=self.use_image_cache,
+            thumbs=self.thumbs,
+        )
+        for obj, city, url in missing_images:
+            img_data = images.get(url)
+            file_ext = self.image_ext
+
+            if not img_data:
+                color = SPACENTER_COLORS.get(city.name_en, (80, 120, 150))
+                img_data = _make_placeholder_image(f"USH Spa – {city.name_en}", width=1200, height=800, color=color)
+                file_ext = "png"
+                self.stdout.write(self.style.WARNING(f"    ⚠ Download failed, using placeholder for: {obj.name}"))
+
+            fname = f"spacenter_{obj.id}.{file_ext}"
+            obj.image.save(fname, ContentFile(img_data), save=False)
+            obj.updated_at = now
+            self.stdout.write(f"    Image set for: {obj.name}")
+        # Store all new image paths in one bulk UPDATE
+        if missing_images:
+            bulk_update_with_history(
+                [obj for obj, _, _ in missing_images], SpaCenter,
+                fields=["image", "updated_at"], batch_size=500,
+            )
+        invalidate_model_cache(SPA_CENTER_CACHE_PREFIX)
 
     # ── Operating Hours ────────────────────────────────────────
     def _seed_operating_hours(self):
         self.stdout.write("\nSeeding operating hours...")
-        for spa in SpaCenter.objects.all():
-            for day, opening, closing, closed in DEFAULT_HOURS:
-                SpaCenterOperatingHours.objects.update_or_create(
+        spas = list(SpaCenter.objects.all())
+        # One upsert (INSERT ... ON CONFLICT DO UPDATE) for every branch/day
+        SpaCenterOperatingHours.objects.bulk_create(
+            [
+                SpaCenterOperatingHours(
                     spa_center=spa, day_of_week=day,
-                    defaults={"opening_time": opening, "closing_time": closing, "is_closed": closed},
+                    opening_time=opening, closing_time=closing, is_closed=closed,
                 )
+                for spa in spas
+                for day, opening, closing, closed in DEFAULT_HOURS
+            ],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["spa_center", "day_of_week"],
+            update_fields=["opening_time", "closing_time", "is_closed"],
+        )
+        invalidate_model_cache(SPA_CENTER_CACHE_PREFIX)
+        for spa in spas:
             self.stdout.write(f"  Set hours for: {spa.name}")
 
     def _seed_services_with_images(self):
         self.stdout.write("\nSeeding services with images...")
-        addons = list(AddOnService.objects.all())
-        from accounts.models import User, UserType
-        admin = User.objects.filter(user_type=UserType.ADMIN).first()
-
-        for spa in SpaCenter.objects.select_related("country", "city").all():
+        specialties = {s.name_en: s for s in Specialty.objects.all()}
+        missing_images = []
+
+        spas = list(SpaCenter.objects.select_related("country", "city"))
+        existing = {(svc.spa_center_id, svc.name_en): svc for svc in Service.objects.filter(spa_center__in=spas)}
+        now = timezone.now()
+        services, to_create, to_update = [], [], []
+        for spa in spas:
             # Each branch gets 5-10 services (we cycle through all 10, use 8 for variety)
             branch_services = SERVICES[:8]  # 8 services per branch
             for i, sd in enumerate(branch_services):
-                specialty = Specialty.objects.get(name_en=sd["spec"])
-                svc, created = Service.objects.update_or_create(
-                    name_en=sd["name_en"], spa_center=spa,
-                    defaults={
-                        "name": sd["name_en"], "name_ar": sd["name_ar"],
-                        "description": sd["desc_en"], "description_en": sd["desc_en"], "description_ar": sd["desc_ar"],
-                        "ideal_for": sd["ideal_en"], "ideal_for_en": sd["ideal_en"], "ideal_for_ar": sd["ideal_ar"],
-                        "specialty": specialty, "country": spa.country, "city": spa.city,
-                        "duration_minutes": sd["dur"], "currency": BRANCH_TEMPLATE.get(spa.country.code, {}).get("currency", "QAR"),
-                        "base_price": sd["price"], "discount_price": sd["disc"],
-                        "is_for_male": (gender := random.choice(GENDER_OPTIONS))[0], "is_for_female": gender[1],
-                        "spa_center": spa, "sort_order": i + 1,
-                    },
-                )
-                if addons:
-                    svc.add_on_services.set(addons)
-
-                # Create 1 primary image per service if none exists
-                if not svc.images.exists():
-                    img_url = SERVICE_IMAGE_URLS.get(sd["name_en"])
-                    img_data = None
-                    file_ext = "jpg"
-
-                    if img_url:
-                        self.stdout.write(f"    Downloading image for: {sd['name_en']}...")
-                        img_data = _download_image(img_url)
-
-                    if not img_data:
-                        # Fallback to placeholder if download fails
-                        color = SPECIALTY_COLORS.get(sd["spec"], (100, 130, 160))
-                        img_data = _make_placeholder_image(sd["name_en"], color=color)
-                        file_ext = "png"
-                        self.stdout.write(self.style.WARNING(f"    ⚠ Download failed, using placeholder for: {sd['name_en']}"))
-
-                    fname = f"{svc.id}.{file_ext}"
-                    si = ServiceImage(service=svc, alt_text=sd["name_en"], is_primary=True, sort_order=0)
-                    si.image.save(fname, ContentFile(img_data), save=True)
-
-                status = "Created" if created else "Updated"
-                self.stdout.write(f"  {status}: {svc.name} @ {spa.name}")
+                specialty = specialties[sd["spec"]]
+                defaults = {
+                    "name": sd["name_en"], "name_ar": sd["name_ar"],
+                    "description": sd["desc_en"], "description_en": sd["desc_en"], "description_ar": sd["desc_ar"],
+                    "ideal_for": sd["ideal_en"], "ideal_for_en": sd["ideal_en"], "ideal_for_ar": sd["ideal_ar"],
+                    "specialty": specialty, "country": spa.country, "city": spa.city,
+                    "duration_minutes": sd["dur"], "currency": BRANCH_TEMPLATE.get(spa.country.code, {}).get("currency", "QAR"),
+                    "base_price": sd["price"], "discount_price": sd["disc"],
+                    "is_for_male": (gender := random.choice(GENDER_OPTIONS))[0], "is_for_female": gender[1],
+                    "spa_center": spa, "sort_order": i + 1,
+                }
+                svc = existing.get((spa.id, sd["name_en"]))
+                if svc is None:
+                    svc = Service(name_en=sd["name_en"], **defaults)
+                    to_create.append(svc)
+                else:
+                    for field, value in defaults.items():
+                        setattr(svc, field, value)
+                    svc.updated_at = now
+                    to_update.append(svc)
+                services.append((svc, sd, spa))
+
+        # Insert and update all services in bulk (with history) rather than
+        # an update_or_create round trip per service and branch
+        with transaction.atomic():
+            bulk_create_with_history(to_create, Service, batch_size=500)
+            if to_update:
+                bulk_update_with_history(to_update, Service, fields=[*defaults, "updated_at"], batch_size=500)
+        if services:
+            invalidate_model_cache(SERVICE_CACHE_PREFIX)
+            invalidate_model_cache(SPA_CENTER_CACHE_PREFIX)
+
+        # New services have no images; check the existing ones in one query
+        with_images = set(
+            ServiceImage.objects.filter(service__in=to_update).values_list("service_id", flat=True).distinct()
+        )
+        created = {svc.pk for svc in to_create}
+        for svc, sd, spa in services:
+            if svc.pk not in with_images:
+                missing_images.append((svc, sd, SERVICE_IMAGE_URLS.get(sd["name_en"])))
+
+            status = "Created" if svc.pk in created else "Updated"
+            self.stdout.write(f"  {status}: {svc.name} @ {spa.name}")
+
+        # Create 1 primary image per service if none exists. Branches share
+        # the same service URLs, so each one is only downloaded once.
+        if missing_images:
+            self.stdout.write(f"  Downloading images for {len(missing_images)} service(s)...")
+        images = download_images_bulk(
+            [url for _, _, url in missing_images],
+            use_cache=self.use_image_cache,
+            thumbs=self.thumbs,
+        )
+        service_images = []
+        for svc, sd, url in missing_images:
+            img_data = images.get(url)
+            file_ext = self.image_ext
+
+            if not img_data:
+                # Fallback to placeholder if download fails
+                color = SPECIALTY_COLORS.get(sd["spec"], (100, 130, 160))
+                img_data = _make_placeholder_image(sd["name_en"], color=color)
+                file_ext = "png"
+                self.stdout.write(self.style.WARNING(f"    ⚠ Download failed, using placeholder for: {sd['name_en']}"))
+
+            fname = f"{svc.id}.{file_ext}"
+            si = ServiceImage(service=svc, alt_text=sd["name_en"], is_primary=True, sort_order=0)
+            si.image.save(fname, ContentFile(img_data), save=False)
+            service_images.append(si)
+        # These services had no images, so no other primary needs demoting
+        # and ServiceImage.save() can be skipped for a single bulk INSERT.
+        ServiceImage.objects.bulk_create(service_images, batch_size=500)
+        if service_images:
+            invalidate_model_cache(SERVICE_CACHE_PREFIX)
 
     # ── Product Categories ─────────────────────────────────────
     def _seed_product_categories(self):
@@ -458,6 +632,7 @@ class Command(BaseCommand):
     # ── Base Products ──────────────────────────────────────────
     def _seed_base_products(self):
         self.stdout.write("\nSeeding base products...")
+        missing_images = []
         for d in BASE_PRODUCTS:
             obj, created = BaseProduct.objects.update_or_create(
                 sku=d["sku"],
@@ -470,21 +645,35 @@ class Command(BaseCommand):
                 },
             )
 
-            # Download and save product image if none exists
-            if not obj.image:
-                img_url = PRODUCT_IMAGE_URLS.get(d["sku"])
-                if img_url:
-                    self.stdout.write(f"    Downloading image for: {obj.name}...")
-                    img_data = _download_image(img_url)
-                    if img_data:
-                        fname = f"product_{obj.id}.jpg"
-                        obj.image.save(fname, ContentFile(img_data), save=True)
-                        self.stdout.write(f"    Image saved for: {obj.name}")
-                    else:
-                        self.stdout.write(self.style.WARNING(f"    ⚠ Download failed for: {obj.name}"))
+            if not obj.image and PRODUCT_IMAGE_URLS.get(d["sku"]):
+                missing_images.append((obj, PRODUCT_IMAGE_URLS[d["sku"]]))
 
             self.stdout.write(f"  {'Created' if created else 'Updated'}: {obj.name}")
 
+        # Download and save product images for products that have none
+        if missing_images:
+            self.stdout.write(f"  Downloading {len(missing_images)} product image(s)...")
+        images = download_images_bulk(
+            [url for _, url in missing_images],
+            use_cache=self.use_image_cache,
+            thumbs=self.thumbs,
+        )
+        now = timezone.now()
+        with_images = []
+        for obj, img_url in missing_images:
+            img_data = images.get(img_url)
+            if img_data:
+                fname = f"product_{obj.id}.{self.image_ext}"
+                obj.image.save(fname, ContentFile(img_data), save=False)
+                obj.updated_at = now
+                with_images.append(obj)
+                self.stdout.write(f"    Image saved for: {obj.name}")
+            else:
+                self.stdout.write(self.style.WARNING(f"    ⚠ Download failed for: {obj.name}"))
+        if with_images:
+            BaseProduct.objects.bulk_update(with_images, ["image", "updated_at"], batch_size=500)
+            invalidate_model_cache(SPA_PRODUCT_CACHE_PREFIX)
+
     # ── Spa Products ───────────────────────────────────────────
     def _seed_spa_products(self):
         self.stdout.write("\nSeeding spa products...")
@@ -525,9 +714,11 @@ class Command(BaseCommand):
             ServiceArrangement.ArrangementType.OPEN_AREA: 5,
         }
 
+        rooms_by_spa = {(r.spa_center_id, r.room_id): r for r in Room.objects.all()}
+
         for spa in SpaCenter.objects.all():
             rooms = {
-                i: Room.objects.get(spa_center=spa, room_id=f"R-{i:02d}")
+                i: rooms_by_spa[(spa.id, f"R-{i:02d}")]
                 for i in range(1, 6)
             }
             for svc in spa.services.all():
@@ -550,7 +741,6 @@ class Command(BaseCommand):
                             "cleanup_duration": 15, 
                         },
                     )
-                    from spacenter.models import ServiceArrangementPrice, ServiceArrangementAddOn, AddOnService
                     ServiceArrangementPrice.objects.update_or_create(
                         service=svc,
                         service_arrangement=obj,
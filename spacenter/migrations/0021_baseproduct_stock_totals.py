@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:31
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_stock_totals(apps, schema_editor):
+    """Populate the new stock totals from existing SpaProduct rows."""
+    BaseProduct = apps.get_model("spacenter", "BaseProduct")
+    SpaProduct = apps.get_model("spacenter", "SpaProduct")
+
+    stocks = SpaProduct.objects.filter(product=OuterRef("pk")).order_by().values("product")
+    BaseProduct.objects.update(
+        total_stock=Coalesce(
+            Subquery(stocks.annotate(total=Sum("quantity")).values("total")),
+            0,
+        ),
+        locations_in_stock=Coalesce(
+            Subquery(
+                stocks.annotate(
+                    count=Count("pk", filter=Q(quantity__gt=0))
+                ).values("count")
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "spacenter",
+            "0020_remove_historicalservicearrangement_extra_minutes_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="baseproduct",
+            name="locations_in_stock",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of locations with quantity above zero.",
+                verbose_name="locations in stock",
+            ),
+        ),
+        migrations.AddField(
+            model_name="baseproduct",
+            name="total_stock",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Total quantity across all locations.",
+                verbose_name="total stock",
+            ),
+        ),
+        migrations.RunPython(
+            code=backfill_stock_totals,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
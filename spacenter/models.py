@@ -11,6 +11,8 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 from simple_history.models import HistoricalRecords
 
@@ -710,6 +712,20 @@ class BaseProduct(models.Model):
     is_featured = models.BooleanField(_("featured"), default=False)
     is_visible = models.BooleanField(_("visible"), default=True)
 
+    # Stock totals — recomputed from SpaProduct rows whenever stock changes
+    total_stock = models.PositiveIntegerField(
+        _("total stock"),
+        default=0,
+        editable=False,
+        help_text=_("Total quantity across all locations."),
+    )
+    locations_in_stock = models.PositiveIntegerField(
+        _("locations in stock"),
+        default=0,
+        editable=False,
+        help_text=_("Number of locations with quantity above zero."),
+    )
+
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
 
@@ -731,6 +747,25 @@ class BaseProduct(models.Model):
         """Check if product is active."""
         return self.status == "active"
 
+    @classmethod
+    def refresh_stock_totals(cls, product_ids):
+        """Recompute stock totals for the given products in a single UPDATE."""
+        stocks = SpaProduct.objects.filter(product=OuterRef("pk")).order_by().values("product")
+        return cls.objects.filter(pk__in=product_ids).update(
+            total_stock=Coalesce(
+                Subquery(stocks.annotate(total=Sum("quantity")).values("total")),
+                0,
+            ),
+            locations_in_stock=Coalesce(
+                Subquery(
+                    stocks.annotate(
+                        count=Count("pk", filter=Q(quantity__gt=0))
+                    ).values("count")
+                ),
+                0,
+            ),
+        )
+
 
 class SpaProduct(models.Model):
     """
@@ -12,6 +12,7 @@ from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 
+from config.cache_utils import SERVICE_CACHE_PREFIX, invalidate_model_cache
 
 from .models import (
     AddOnService,
@@ -416,14 +417,20 @@ class ServiceCreateSerializer(serializers.ModelSerializer):
         
         service = Service.objects.create(**validated_data)
         
-        # Create images
-        for idx, image in enumerate(images_data):
-            ServiceImage.objects.create(
-                service=service,
-                image=image,
-                is_primary=(idx == 0),
-                sort_order=idx,
-            )
+        # Create images. The service is new, so there is no other primary
+        # image for ServiceImage.save() to demote; insert them in one query.
+        if images_data:
+            ServiceImage.objects.bulk_create([
+                ServiceImage(
+                    service=service,
+                    image=image,
+                    is_primary=(idx == 0),
+                    sort_order=idx,
+                )
+                for idx, image in enumerate(images_data)
+            ])
+            # bulk_create skips the post_save cache receiver
+            invalidate_model_cache(SERVICE_CACHE_PREFIX)
         
         # Assign to branches
         if branch_ids:
@@ -3,11 +3,12 @@ Signals for automatic cache invalidation in the spacenter app.
 
 When any cached model is saved or deleted, the corresponding cache
 is cleared so that subsequent API requests return fresh data.
+SpaProduct changes also refresh the stock totals on their BaseProduct.
 """
 
 import logging
 
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from config.cache_utils import (
@@ -133,6 +134,28 @@ def invalidate_spa_product_cache(sender, **kwargs):
     invalidate_model_cache(SPA_PRODUCT_CACHE_PREFIX)
 
 
+@receiver(pre_save, sender=SpaProduct)
+def remember_previous_product(sender, instance, **kwargs):
+    """Keep the stored product so a reassigned row refreshes both totals."""
+    if instance._state.adding:
+        instance._previous_product_id = None
+        return
+    instance._previous_product_id = (
+        SpaProduct.objects.filter(pk=instance.pk)
+        .values_list("product_id", flat=True)
+        .first()
+    )
+
+
+@receiver([post_save, post_delete], sender=SpaProduct)
+def refresh_base_product_stock(sender, instance, **kwargs):
+    product_ids = {instance.product_id}
+    previous_product_id = getattr(instance, "_previous_product_id", None)
+    if previous_product_id:
+        product_ids.add(previous_product_id)
+    BaseProduct.refresh_stock_totals(product_ids)
+
+
 # ============================================================================
 # HomeService
 # ============================================================================